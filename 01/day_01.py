@@ -0,0 +1,237 @@
+# Christopher Chamberlain
+# Advent of Code 2023
+# Day 1
+
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable
+
+from aoc.loader import MappedFile, chunk_ranges, iter_lines, load_lines
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the vectorized path falls back to the loop.
+    np = None
+
+# ----
+# Construct helpers
+# ----
+
+number_words = {
+    b"one": 1,
+    b"two": 2,
+    b"three": 3,
+    b"four": 4,
+    b"five": 5,
+    b"six": 6,
+    b"seven": 7,
+    b"eight": 8,
+    b"nine": 9,
+}
+
+# Every byte that is not a digit.
+DIGITS = b"0123456789"
+NON_DIGITS = bytes(c for c in range(256) if c not in DIGITS)
+
+
+class Automaton:
+    """
+    An Aho-Corasick automaton, matching many patterns in a single pass over the input.
+    Transitions are compiled into a dense table of 256 next states per state, so each byte is one lookup.
+    """
+
+    def __init__(self, patterns: dict[bytes, int]):
+
+        # Build the trie of patterns.
+        goto: list[dict[int, int]] = [{}]
+        depth: list[int] = [0]
+        output: list[tuple[int, int] | None] = [None]
+        for pattern, value in patterns.items():
+            state = 0
+            for c in pattern:
+                if c not in goto[state]:
+                    goto[state][c] = len(goto)
+                    goto.append({})
+                    depth.append(depth[state] + 1)
+                    output.append(None)
+                state = goto[state][c]
+            output[state] = (len(pattern), value)
+
+        # Walk the trie breadth first, following failure links to fill in the missing transitions.
+        table = [[0] * 256 for _ in goto]
+        fail = [0] * len(goto)
+
+        queue = deque[int]()
+        for c, child in goto[0].items():
+            table[0][c] = child
+            queue.append(child)
+
+        while queue:
+            state = queue.popleft()
+
+            # Without a match of its own, a state reports the longest match of its failure state.
+            if output[state] is None:
+                output[state] = output[fail[state]]
+
+            for c in range(256):
+                if (child := goto[state].get(c)) is not None:
+                    fail[child] = table[fail[state]][c]
+                    table[state][c] = child
+                    queue.append(child)
+                else:
+                    table[state][c] = table[fail[state]][c]
+
+        # The length of the text each state has matched so far.
+        self.depth = depth
+        # The longest (length, value) match ending at each state.
+        self.output = output
+        self.table = table
+
+    def first(self, data: Iterable[int]) -> int | None:
+        """
+        Finds the value of the earliest starting match, stopping as soon as no later byte can change the answer.
+        """
+
+        table, output, depth = self.table, self.output, self.depth
+
+        best_start = sys.maxsize
+        best_value = None
+
+        state = 0
+        for i, c in enumerate(data):
+            state = table[state][c]
+
+            # Found a match that begins earlier?
+            if (match := output[state]) is not None and (start := i - match[0] + 1) < best_start:
+                best_start, best_value = start, match[1]
+
+            # Only a match still in progress could start earlier, and it began at most `depth` bytes ago.
+            if i - depth[state] + 1 >= best_start:
+                break
+
+        return best_value
+
+
+# Every spelled or written digit, and their value.
+DIGIT_PATTERNS = number_words | {str(n).encode(): n for n in range(10)}
+
+# Finds the first digit scanning forward, and the last digit scanning the reversed line with reversed patterns.
+FIRST_DIGIT = Automaton(DIGIT_PATTERNS)
+LAST_DIGIT = Automaton({pattern[::-1]: value for pattern, value in DIGIT_PATTERNS.items()})
+
+# ----
+# Parse input
+# ----
+
+
+def parse(text: str) -> list[bytes]:
+    return text.encode('ascii').splitlines()
+
+
+def load(path: str) -> Iterable[bytes]:
+    """ Lazily reads lines from the memory mapped file, for inputs larger than memory. The file is only open while the lines are read. """
+    return load_lines(path)
+
+# ----
+# Compute answer
+# ----
+
+
+def part1(input: Iterable[bytes]) -> int:
+
+    answer = 0
+    for line in input:
+        digits = line.translate(None, NON_DIGITS)
+        answer += int(digits[:1] + digits[-1:])
+
+    return answer  # 53194
+
+
+def part1_vectorized(buffer: bytes, block_size: int = 1 << 26) -> int:
+    """
+    Computes part 1 straight from the raw input bytes (ie. `bytes` or a memory map) with NumPy,
+    without a Python level loop over the lines. The buffer is processed in blocks of whole lines to bound memory.
+    """
+
+    if np is None:
+        return part1(iter_lines(buffer))
+
+    answer = 0
+
+    start, end = 0, len(buffer)
+    while start < end:
+
+        # Find the end of the block, just after the last line ending that fits.
+        stop = end
+        if end - start > block_size:
+            if (newline := buffer.rfind(b"\n", start, start + block_size)) < 0:
+                newline = buffer.find(b"\n", start + block_size)
+            stop = end if newline < 0 else newline + 1
+
+        answer += sum_block(np.frombuffer(buffer, np.uint8, stop - start, start))
+        start = stop
+
+    return answer
+
+
+def sum_block(data: 'np.ndarray') -> int:
+    """ Sums the two digit number of each line in a block of whole lines. """
+
+    digits = np.flatnonzero((data >= ord('0')) & (data <= ord('9')))
+    if not digits.size:
+        return 0
+
+    # The line of each digit is the number of line endings before it.
+    lines = np.searchsorted(np.flatnonzero(data == ord('\n')), digits)
+
+    # A digit is the first (or last) of its line when the line changes before (or after) it.
+    boundary = lines[1:] != lines[:-1]
+    first = digits[np.concatenate(([True], boundary))]
+    last = digits[np.concatenate((boundary, [True]))]
+
+    tens = (data[first] - ord('0')).sum(dtype=np.int64)
+    ones = (data[last] - ord('0')).sum(dtype=np.int64)
+    return int(tens) * 10 + int(ones)
+
+
+def part2(input: Iterable[bytes]) -> int:
+
+    answer = 0
+    for line in input:
+        answer += FIRST_DIGIT.first(line) * 10 + LAST_DIGIT.first(reversed(line))
+
+    return answer  # 54249
+
+
+# Alternative implementations, compared by `python -m aoc.bench --variants`.
+VARIANTS = {
+    "part1": lambda text: (part1, parse(text)),
+    "part1_vectorized": lambda text: (part1_vectorized, text.encode('ascii')),
+}
+
+
+# ----
+# Parallel mode, for very large inputs
+# ----
+
+
+def solve_chunk(path: str, start: int, end: int, part: int) -> int:
+    """ Solves one byte range of the input, mapping the file in this process so nothing is sent between processes. """
+    with MappedFile(path) as file:
+        return (part1 if part == 1 else part2)(file.lines(start, end))
+
+
+def solve_parallel(path: str, part: int, jobs: int | None = None) -> int:
+    """
+    Splits the input at line boundaries and sums the chunks across a pool of processes.
+    There are a few chunks per process, so a slow chunk does not hold up the whole pool.
+    """
+
+    jobs = jobs or os.cpu_count() or 1
+
+    with ProcessPoolExecutor(jobs) as pool:
+        chunks = [pool.submit(solve_chunk, str(path), start, end, part) for start, end in chunk_ranges(path, jobs * 4)]
+        return sum(chunk.result() for chunk in chunks)
+
@@ -0,0 +1,159 @@
+# Christopher Chamberlain
+# Advent of Code 2023
+# Day 2
+
+import itertools
+import re
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Iterable
+
+CUBES_REGEX = re.compile(r"(\d+) (red|green|blue)")
+
+# The bag is loaded with 12 red, 13 green and 14 blue cubes.
+LIMITS = (12, 13, 14)
+
+
+@dataclass
+class Games:
+    """
+    Columnar store of the games, the i-th game is `number[i]` with the most cubes of each color shown
+    in any subset being `red[i]`, `green[i]` and `blue[i]`.
+    """
+
+    number: array = field(default_factory=lambda: array('q'))
+    red: array = field(default_factory=lambda: array('q'))
+    green: array = field(default_factory=lambda: array('q'))
+    blue: array = field(default_factory=lambda: array('q'))
+
+    def __len__(self) -> int:
+        return len(self.number)
+
+
+class GameIndex:
+    """
+    Dominance index over the games, answering "which games are possible with (r, g, b) cubes" queries.
+
+    The game numbers are accumulated into a 3D prefix sum over the distinct red, green and blue maxima,
+    so each query is three binary searches and one lookup. Memory is the product of the number of
+    distinct maxima of each color, which stays small as the cube counts are small.
+    """
+
+    def __init__(self, games: Games):
+
+        self.reds = sorted(set(games.red))
+        self.greens = sorted(set(games.green))
+        self.blues = sorted(set(games.blue))
+
+        # Dimensions of the tables, the leading zero plane makes "no cubes of a color" a valid lookup.
+        R, G, B = len(self.reds) + 1, len(self.greens) + 1, len(self.blues) + 1
+        self.strides = (G * B, B)
+
+        totals = [0] * (R * G * B)
+        counts = [0] * (R * G * B)
+
+        red_index = {value: index + 1 for index, value in enumerate(self.reds)}
+        green_index = {value: index + 1 for index, value in enumerate(self.greens)}
+        blue_index = {value: index + 1 for index, value in enumerate(self.blues)}
+
+        for number, red, green, blue in zip(games.number, games.red, games.green, games.blue):
+            cell = red_index[red] * G * B + green_index[green] * B + blue_index[blue]
+            totals[cell] += number
+            counts[cell] += 1
+
+        # Accumulate along each axis in turn, each cell then sums every game it dominates.
+        for stride, size in ((G * B, R), (B, G), (1, B)):
+            for cell in range(len(totals)):
+                if (cell // stride) % size:
+                    totals[cell] += totals[cell - stride]
+                    counts[cell] += counts[cell - stride]
+
+        self.totals = totals
+        self.counts = counts
+
+        # Games ordered by their red cubes, for listing the possible games.
+        self.by_red = sorted(zip(games.red, games.green, games.blue, games.number))
+
+    def cell(self, red: int, green: int, blue: int) -> int:
+        return (bisect_right(self.reds, red) * self.strides[0]
+                + bisect_right(self.greens, green) * self.strides[1]
+                + bisect_right(self.blues, blue))
+
+    def total(self, red: int, green: int, blue: int) -> int:
+        """ The sum of the numbers of the games that are possible. """
+        return self.totals[self.cell(red, green, blue)]
+
+    def count(self, red: int, green: int, blue: int) -> int:
+        """ The number of games that are possible. """
+        return self.counts[self.cell(red, green, blue)]
+
+    def games(self, red: int, green: int, blue: int) -> list[int]:
+        """ The numbers of the games that are possible, only the games with few enough red cubes are visited. """
+
+        if not self.count(red, green, blue):
+            return []
+
+        candidates = itertools.islice(self.by_red, bisect_right(self.by_red, (red, float('inf'))))
+        return sorted(n for _, g, b, n in candidates if g <= green and b <= blue)
+
+    def batch_totals(self, queries: Iterable[tuple[int, int, int]]) -> list[int]:
+        return [self.total(*query) for query in queries]
+
+
+def parse(text: str) -> Games:
+
+    games = Games()
+
+    # Game N: subset 1; subset 2;
+    for line in text.splitlines():
+        header, _, subsets = line.partition(':')
+
+        counts = {
+            'red': 0,
+            'green': 0,
+            'blue': 0,
+        }
+
+        # Single pass over every count of every subset.
+        for count, color in CUBES_REGEX.findall(subsets):
+            counts[color] = max(counts[color], int(count))
+
+        # Parse the game number
+        games.number.append(int(header[5:]))
+        games.red.append(counts['red'])
+        games.green.append(counts['green'])
+        games.blue.append(counts['blue'])
+
+    return games
+
+
+def possible_total(games: Games, red: int, green: int, blue: int) -> int:
+    """ Sums the numbers of the games that are possible with the given cubes, by scanning every game. """
+
+    answer = 0
+    for number, r, g, b in zip(games.number, games.red, games.green, games.blue):
+        if (r <= red) and (g <= green) and (b <= blue):
+            answer += number
+
+    return answer
+
+
+def part1(games: Games) -> int:
+    return possible_total(games, *LIMITS)  # 2685
+
+
+def part2(games: Games) -> int:
+
+    # Compute "power"
+    return sum(r * g * b for r, g, b in zip(games.red, games.green, games.blue))  # 83707
+
+
+# A batch of threshold queries, for comparing a rescan per query with the index.
+BENCH_QUERIES = list(itertools.product(range(0, 25, 2), range(0, 25, 3), range(0, 25, 2)))
+
+# Alternative implementations, compared by `python -m aoc.bench --variants`.
+VARIANTS = {
+    "queries_rescan": lambda text: (lambda games: [possible_total(games, *q) for q in BENCH_QUERIES], parse(text)),
+    "queries_index": lambda text: (lambda games: GameIndex(games).batch_totals(BENCH_QUERIES), parse(text)),
+}
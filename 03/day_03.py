@@ -0,0 +1,245 @@
+# Christopher Chamberlain
+# Advent of Code 2023
+# Day 3
+
+import collections
+import itertools
+import math
+import re
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator
+
+from aoc.grid import Grid
+from aoc.loader import load_grid, load_lines
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the vectorized path falls back to the loop.
+    np = None
+
+# Lookup tables, classifying each byte of the schematic.
+IS_DIGIT = bytes(ord('0') <= c <= ord('9') for c in range(256))
+IS_SYMBOL = bytes(c != ord('.') and not IS_DIGIT[c] for c in range(256))
+
+NUMBER_REGEX = re.compile(rb"\d+")
+
+
+@dataclass
+class PartNumber:
+    value: int
+    start: int  # cell index of the first digit
+    end: int  # cell index just past the last digit
+    symbols: list[int] = field(default_factory=list)  # cell indices of every adjacent symbol
+
+
+class Schematic:
+    """
+    Index of the numbers and symbols of a schematic, built by a single scan of the grid.
+
+    Every number records each distinct symbol it touches, and every symbol the numbers touching it,
+    so both parts (and "which numbers are next to this symbol" queries) are answered without rescanning.
+    """
+
+    def __init__(self, grid: Grid):
+
+        self.grid = grid
+        self.numbers = list[PartNumber]()
+
+        # Symbol cell index -> indices into `numbers`, and symbol byte -> symbol cell indices.
+        self.adjacent: dict[int, list[int]] = collections.defaultdict(list)
+        self.by_symbol: dict[int, list[int]] = collections.defaultdict(list)
+
+        cells = grid.cells
+        neighbors = grid.neighbors8
+
+        for y in range(grid.height):
+
+            index = grid.index(0, y)
+            end = index + grid.width
+            while index < end:
+
+                ch = cells[index]
+                if IS_SYMBOL[ch]:
+                    self.by_symbol[ch].append(index)
+
+                if not IS_DIGIT[ch]:
+                    index += 1
+                    continue
+
+                number = PartNumber(0, index, index)
+                seen = set[int]()
+
+                # Scan the number, the border always terminates the scan.
+                while IS_DIGIT[ch := cells[index]]:
+
+                    # Record each adjacent symbol once, a long number can touch the same symbol from several digits.
+                    for offset in neighbors:
+                        if IS_SYMBOL[cells[neighbor := index + offset]] and neighbor not in seen:
+                            seen.add(neighbor)
+                            number.symbols.append(neighbor)
+
+                    # Accumulate number.
+                    number.value = number.value * 10 + (ch - ord('0'))
+                    index += 1
+
+                number.end = index
+                for symbol in number.symbols:
+                    self.adjacent[symbol].append(len(self.numbers))
+                self.numbers.append(number)
+
+        self.adjacent = dict(self.adjacent)
+        self.by_symbol = dict(self.by_symbol)
+
+    def symbols(self, symbol: str) -> list[int]:
+        """ The cell indices of every occurrence of a symbol. """
+        return self.by_symbol.get(ord(symbol), [])
+
+    def numbers_adjacent(self, index: int) -> list[int]:
+        """ The values of the numbers touching the symbol at a cell index. """
+        return [self.numbers[n].value for n in self.adjacent.get(index, ())]
+
+    def part_numbers(self) -> Iterator[int]:
+        """ The values of the numbers touching any symbol. """
+        return (number.value for number in self.numbers if number.symbols)
+
+    def ratios(self, symbols: Iterable[str] = '*', count: int = 2) -> Iterator[int]:
+        """ The products of the numbers around each of the given symbols touching exactly `count` numbers. """
+        for symbol in symbols:
+            for index in self.symbols(symbol):
+                if len(parts := self.numbers_adjacent(index)) == count:
+                    yield math.prod(parts)
+
+
+@dataclass
+class Row:
+    """ A row of the schematic in the streaming window, padded with empty space on both ends. """
+
+    cells: bytes
+    starts: list[int]  # column of the first digit of each number
+    numbers: list[tuple[int, int, int]]  # (start, end, value) of each number, left to right
+
+    @classmethod
+    def scan(cls, line: str | bytes) -> 'Row':
+
+        cells = b'.' + (line.encode('ascii') if isinstance(line, str) else bytes(line)) + b'.'
+        numbers = [(match.start(), match.end(), int(match[0])) for match in NUMBER_REGEX.finditer(cells)]
+        return cls(cells, [start for start, _, _ in numbers], numbers)
+
+    def around(self, x: int) -> Iterator[int]:
+        """ The values of the numbers in this row that touch column x or either column beside it. """
+
+        # Numbers are disjoint and ordered, so walk left from the last one starting by column x + 1.
+        for start, end, value in reversed(self.numbers[:bisect_right(self.starts, x + 1)]):
+            if end < x:
+                break
+            yield value
+
+
+EMPTY_ROW = Row(b'', [], [])
+
+
+def stream(lines: Iterable[str | bytes]) -> Iterator[tuple[int, int]]:
+    """
+    Yields the part number sum and gear ratio sum of each row, as soon as the row below it has been read.
+    Adjacency never reaches further than one row, so only a window of three rows is held at a time.
+    """
+
+    above, row = EMPTY_ROW, None
+    for below in itertools.chain(map(Row.scan, lines), [EMPTY_ROW]):
+
+        if row is not None:
+            window = (above, row, below)
+
+            parts = 0
+            for start, end, value in row.numbers:
+                if any(IS_SYMBOL[c] for r in window for c in r.cells[start - 1:end + 1]):
+                    parts += value
+
+            gears = 0
+            x = row.cells.find(b'*')
+            while x >= 0:
+                if len(values := [v for r in window for v in r.around(x)]) == 2:
+                    gears += math.prod(values)
+                x = row.cells.find(b'*', x + 1)
+
+            yield parts, gears
+            above = row
+
+        row = below
+
+
+def solve_stream(path: str, part: int) -> int:
+
+    # Single pass over the memory mapped lines, holding three rows at a time.
+    return sum(totals[part - 1] for totals in stream(load_lines(path)))
+
+
+def parse(text: str) -> Schematic:
+
+    # Load input into the grid, the border is empty space.
+    return Schematic(Grid.from_lines(text.splitlines(), border=ord('.')))
+
+
+def load(path: str) -> Schematic:
+
+    # Copy the memory mapped schematic straight into the grid, without decoding each line.
+    return Schematic(load_grid(path, border=ord('.')))
+
+
+def part1(schematic: Schematic) -> int:
+    return sum(schematic.part_numbers())  # 554003
+
+
+def part1_vectorized(grid: Grid) -> int:
+    """
+    Computes part 1 with whole grid array operations, rather than probing the neighbors of each digit.
+
+    The symbol mask is dilated by one cell in every direction (the border keeps shifted cells from wrapping),
+    then a number is a part number when any digit in its span lies in the dilated mask.
+    """
+
+    if np is None:
+        return part1(Schematic(grid))
+
+    cells = np.frombuffer(grid.cells, np.uint8)
+    size = len(cells)
+
+    digit = (cells >= ord('0')) & (cells <= ord('9'))
+    symbol = ~digit & (cells != ord('.'))
+
+    # Dilate the symbol mask, each cell is adjacent when any neighbor is a symbol.
+    adjacent = np.zeros(size, bool)
+    for offset in grid.neighbors8:
+        lo, hi = max(0, -offset), size - max(0, offset)
+        adjacent[lo:hi] |= symbol[lo + offset:hi + offset]
+
+    # Spans of digits, the border guarantees a run never touches either end of the array.
+    starts = np.flatnonzero(digit[1:] & ~digit[:-1]) + 1
+    ends = np.flatnonzero(digit[:-1] & ~digit[1:]) + 1
+    if not starts.size:
+        return 0
+
+    # A span is a part number when any of its cells is adjacent to a symbol.
+    touching = np.concatenate(([0], np.cumsum(adjacent & digit)))
+    is_part = touching[ends] > touching[starts]
+
+    # Numeric value of each span, each digit is weighted by its place within the span.
+    positions = np.flatnonzero(digit)
+    span = np.searchsorted(starts, positions, side='right') - 1
+    place = ends[span] - 1 - positions
+    weighted = (cells[positions] - ord('0')).astype(np.int64) * (10 ** place.astype(np.int64))
+    numbers = np.add.reduceat(weighted, np.searchsorted(positions, starts))
+
+    return int(numbers[is_part].sum())
+
+
+def part2(schematic: Schematic) -> int:
+    return sum(schematic.ratios('*'))  # 87263515
+
+
+# Alternative implementations, compared by `python -m aoc.bench --variants`.
+VARIANTS = {
+    "part1_index": lambda text: (lambda grid: part1(Schematic(grid)), parse(text).grid),
+    "part1_vectorized": lambda text: (part1_vectorized, parse(text).grid),
+}
@@ -0,0 +1,113 @@
+# Christopher Chamberlain
+# Advent of Code 2023
+# Day 4
+
+import itertools
+from collections import deque
+from typing import Iterable, Iterator
+
+from aoc.loader import load_lines
+
+
+class BitTable(dict[str, int]):
+    """ Maps the text of a number to its bit, filling in each new number on first use. """
+
+    def __missing__(self, number: str) -> int:
+        bit = self[number] = 1 << int(number)
+        return bit
+
+
+# Card numbers are small, so the bit of each is only computed once.
+BITS = BitTable()
+
+
+def mask(numbers: str) -> int:
+    """ Packs a list of numbers into the bits of an integer. """
+
+    bits = 0
+    for number in numbers.split():
+        bits |= BITS[number]
+
+    return bits
+
+
+def parse_card(line: str) -> tuple[int, int]:
+
+    card, data = line.split(':')
+
+    # Parse number lists, as bitmasks.
+    win_numbers, our_numbers = data.split('|')
+    return mask(win_numbers), mask(our_numbers)
+
+
+def parse(text: str) -> list[tuple[int, int]]:
+    return [parse_card(line) for line in text.splitlines()]
+
+
+def match_counts(cards: list[tuple[int, int]]) -> list[int]:
+    """ The number of winning numbers we have on each card, the popcount of the common bits. """
+    return [(win_numbers & our_numbers).bit_count() for win_numbers, our_numbers in cards]
+
+
+def part1(input: list[tuple[int, int]]) -> int:
+
+    # Accumulate score, doubling for each match after the first.
+    return sum(1 << (matches - 1) for matches in match_counts(input) if matches)  # 27059
+
+
+def card_copies(matches: Iterable[int]) -> Iterator[int]:
+    """
+    Yields the number of copies of each card, consuming the match counts lazily.
+
+    The copies a card wins are added to a running count of extra copies, and taken away again by a
+    difference array once they reach past the last card they cover. The difference array only ever
+    reaches as far ahead as the largest match count, and each card is handled in amortized O(1).
+    """
+
+    extra = 0
+
+    # ends[k] is the number of copies that stop applying at the card k + 1 places after the current one.
+    ends = deque[int]()
+
+    for score in matches:
+
+        # Copies won by earlier cards that do not reach this card.
+        if ends:
+            extra -= ends.popleft()
+
+        copies = 1 + extra
+        yield copies
+
+        # This card wins a copy of each of the next `score` cards per copy of itself.
+        if score:
+            extra += copies
+            while len(ends) <= score:
+                ends.append(0)
+            ends[score] += copies
+
+
+def stream(lines: Iterable[str | bytes]) -> Iterator[tuple[int, int]]:
+    """
+    Yields the points and the number of copies of each card, reading the cards lazily and discarding each
+    once it is scored. `itertools.accumulate` over either gives the running total while a deck streams in.
+    """
+
+    cards = (parse_card(line.decode('ascii') if isinstance(line, bytes) else line) for line in lines)
+    matches = ((win_numbers & our_numbers).bit_count() for win_numbers, our_numbers in cards)
+
+    # Both are consumed in step, so the tee only ever holds the current card.
+    scores, counts = itertools.tee(matches)
+    for score, copies in zip(scores, card_copies(counts)):
+        yield (1 << (score - 1) if score else 0), copies
+
+
+def solve_stream(path: str, part: int) -> int:
+
+    # Single pass over the memory mapped lines, one card at a time.
+    return sum(totals[part - 1] for totals in stream(load_lines(path)))
+
+
+def part2(input: list[tuple[int, int]]) -> int:
+
+    # The number of matches is the "score" of the card, each card is counted with all of its copies.
+    return sum(card_copies(match_counts(input)))  # 5744979
@@ -0,0 +1,482 @@
+# Christopher Chamberlain
+# Advent of Code 2023
+# Day 5
+
+import functools
+import math
+import os
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, List, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, batches fall back to a lookup per seed.
+    np = None
+
+from aoc.intervals import Interval, IntervalSet
+
+
+@dataclass(slots=True)
+class AlmanacRange:
+    """ A table entry, mapping `src <= value < src + length` to `dst + (value - src)`. """
+
+    dst: int
+    src: int
+    length: int
+
+    @property
+    def src_end(self) -> int:
+        return self.src + self.length
+
+
+@dataclass
+class PiecewiseMap:
+    """
+    A piecewise linear function over the non-negative integers, the i-th piece maps
+    `starts[i] <= value < starts[i + 1]` to `value + offsets[i]`, and the last piece extends forever.
+    Neighboring pieces never share an offset, so the breakpoints are exactly where the mapping changes.
+    """
+
+    starts: list[int]
+    offsets: list[int]
+
+    @staticmethod
+    def append(starts: list[int], offsets: list[int], start: int, offset: int):
+        """ Appends a piece, replacing an empty piece before it and merging it into a piece with the same offset. """
+
+        if starts and starts[-1] == start:
+            starts.pop()
+            offsets.pop()
+
+        if not offsets or offsets[-1] != offset:
+            starts.append(start)
+            offsets.append(offset)
+
+    @classmethod
+    def from_ranges(cls, ranges: list[AlmanacRange]) -> 'PiecewiseMap':
+        """ Builds the map of one almanac table, the gaps between the ranges are identity pieces. """
+
+        starts, offsets = list[int](), list[int]()
+
+        cursor = 0
+        for range in sorted(ranges, key=lambda r: r.src):
+            if range.src > cursor:
+                cls.append(starts, offsets, cursor, 0)
+            cls.append(starts, offsets, range.src, range.dst - range.src)
+            cursor = range.src_end
+
+        cls.append(starts, offsets, cursor, 0)
+        return cls(starts, offsets)
+
+    def __call__(self, value: int) -> int:
+        return value + self.offsets[bisect_right(self.starts, value) - 1]
+
+    def batch(self, values: Sequence[int]) -> Sequence[int]:
+        """ Maps every value at once, with one `searchsorted` over the breakpoints and an offset add. """
+
+        if np is None:
+            return list(map(self, values))
+
+        values = np.asarray(values, dtype=np.int64)
+        pieces = np.searchsorted(np.asarray(self.starts, dtype=np.int64), values, side='right') - 1
+        return values + np.asarray(self.offsets, dtype=np.int64)[pieces]
+
+    def pieces(self, begin: int, end: int | float = math.inf) -> Iterator[tuple[int, int | float, int]]:
+        """ The (begin, end, offset) of each piece, clipped to the range. Only the pieces that overlap it are visited. """
+
+        starts, offsets = self.starts, self.offsets
+
+        i = max(0, bisect_right(starts, begin) - 1)
+        while i < len(starts) and starts[i] < end:
+            yield max(starts[i], begin), min(starts[i + 1], end) if i + 1 < len(starts) else end, offsets[i]
+            i += 1
+
+    def map_range(self, begin: int, end: int) -> Iterator[tuple[int, int]]:
+        """ The mapped (begin, end) ranges of the values in the range, one per piece it overlaps. """
+        for lo, hi, offset in self.pieces(begin, end):
+            yield lo + offset, hi + offset
+
+    def minimum(self, begin: int, end: int) -> int:
+        """ The lowest mapped value of the range, each piece is increasing so only its first value is a candidate. """
+        return min(lo + offset for lo, _, offset in self.pieces(begin, end))
+
+    @functools.cached_property
+    def images(self) -> list[tuple[int, int | float, int]]:
+        """ The (begin, end, offset) of the image of each piece, ordered by where the image begins. """
+        return sorted((lo + offset, hi + offset, offset) for lo, hi, offset in self.pieces(0))
+
+    def preimage(self, begin: int, end: int | float) -> Iterator[tuple[int, int | float, int]]:
+        """ The (begin, end, offset) of each part of the domain that maps into the range, found through the images. """
+
+        images = self.images
+        for lo, hi, offset in images[:bisect_left(images, (end,))]:
+            if hi > begin:
+                yield max(lo, begin) - offset, min(hi, end) - offset, offset
+
+    def then(self, other: 'PiecewiseMap') -> 'PiecewiseMap':
+        """ Composes the maps, the result maps a value through this map and then the other. """
+
+        starts, offsets = list[int](), list[int]()
+
+        # Split each piece wherever its image crosses a breakpoint of the other map.
+        for lo, hi, offset in self.pieces(0):
+            for mapped_lo, _, other_offset in other.pieces(lo + offset, hi + offset):
+                self.append(starts, offsets, mapped_lo - offset, offset + other_offset)
+
+        return PiecewiseMap(starts, offsets)
+
+
+@dataclass
+class Almanac:
+
+    # List of seeds to evaluate
+    seeds: list[int]
+
+    # Look up tables of ranges, that map to subsequent ranges.
+    # In order: seed-to-soil, soil-to-fertilizer, ..., humidity-to-location.
+    maps: list[list[AlmanacRange]]
+
+    @functools.cached_property
+    def tables(self) -> list[PiecewiseMap]:
+        """ The map of each table, in order. """
+        return [PiecewiseMap.from_ranges(ranges) for ranges in self.maps]
+
+    @functools.cached_property
+    def location(self) -> PiecewiseMap:
+        """ The seed to location map, every table composed into one. """
+        return functools.reduce(PiecewiseMap.then, self.tables)
+
+
+def find[T](items: List[T], predicate: Callable[[T], bool]) -> T | None:
+    ''' Finds the first item that matches the predicate. '''
+    return next(filter(predicate, items), None)
+
+
+def find_range(items: List[AlmanacRange], value: int) -> int:
+    ''' Gets the input value mapped to a target value via the ranges given. '''
+    range = find(items, lambda range: range.src <= value < range.src_end)
+    return (range.dst + (value - range.src)) if range is not None else value
+
+
+def compute_mapping(almanacs: list[AlmanacRange], query: Interval) -> list[Interval]:
+
+    segments = list[Interval]()
+
+    # Finds the set of ranges that intersect the query.
+    if almanacs := deque(filter(lambda r: r.src < query.end and query.begin < r.src_end, almanacs)):
+
+        # Begin at the left most edge of the query.
+        minEdge = query.begin
+
+        while almanacs:
+
+            '''
+
+            Case A - Intersecting
+            |-----------------|    query
+               |---|   |---|       almanac
+            |--|---|---|---|--|    result
+
+            Case B - Disjoint
+            |------|               query
+                     |---|  |---|  almanac
+            |------|               result
+
+            '''
+
+            # Get next almanac range to process.
+            almanac = almanacs.popleft()
+
+            # Compute the intersection of this almanac range and query range.
+            begin = max(query.begin, almanac.src)
+            end = min(query.end, almanac.src_end)
+
+            # Computes the offset in the almanac src to dst mapping.
+            offset = begin - almanac.src
+            assert offset >= 0
+
+            # Append identiy 'gap' segment
+            if begin != minEdge:
+                segments.append(Interval(minEdge, begin))
+
+            # Append almanac mapped segment.
+            segments.append(Interval(almanac.dst + offset, almanac.dst + offset + (end - begin)))
+
+            # Advance minimum edge to the end of the intersection.
+            minEdge = end
+
+        # Append trailing identiy 'gap' segment
+        if minEdge != query.end:
+            segments.append(Interval(minEdge, query.end))
+
+    # Query was fully disjoint, does not intersect any almanac range.
+    if not segments:
+        segments = [query]
+
+    return segments
+
+
+def propagate(almanac: Almanac, ranges: Iterable[tuple[int, int]]) -> Iterator[IntervalSet]:
+    """
+    Pushes a set of ranges through each table in turn, yielding the normalized set reached after each stage.
+    Merging between stages keeps the number of fragments bounded by the breakpoints, rather than growing
+    with every split made by the earlier tables.
+    """
+
+    ranges = IntervalSet(ranges)
+    for table in almanac.tables:
+        ranges = IntervalSet(mapped for begin, end in ranges for mapped in table.map_range(begin, end))
+        yield ranges
+
+
+def seed_ranges(almanac: Almanac) -> list[Interval]:
+    """ The seed numbers read as (start, length) pairs, as intervals. """
+    return [Interval(begin, begin + size) for begin, size in zip(almanac.seeds[0::2], almanac.seeds[1::2])]
+
+
+def fragments(almanac: Almanac) -> list[int]:
+    """ The number of ranges the seeds occupy after each stage. """
+    return [len(ranges) for ranges in propagate(almanac, seed_ranges(almanac))]
+
+
+def lowest_location(almanac: Almanac, seeds: IntervalSet) -> int | None:
+    """
+    Finds the lowest location of any of the seeds by inverting the stages lazily. The images of the last table
+    are walked upwards, each is pulled back through the earlier tables one at a time to the seeds it comes from.
+    The walk stops once no later image can begin below the best location found, so a low answer only
+    inverts the first few images.
+    """
+
+    *earlier, last = almanac.tables
+
+    best: int | None = None
+    for begin, end, offset in last.images:
+
+        if best is not None and begin >= best:
+            break
+
+        # Pull the image back a table at a time, keeping the offset from each piece to its locations.
+        pieces = [(begin - offset, end - offset, offset)]
+        for table in reversed(earlier):
+            pieces = [(lo, hi, total + shift) for b, e, total in pieces for lo, hi, shift in table.preimage(b, e)]
+
+        # The lowest seed in a piece has the lowest location of that piece.
+        for lo, hi, total in pieces:
+            if (seed := seeds.lowest(lo, hi)) is not None:
+                best = seed + total if best is None else min(best, seed + total)
+
+    return best
+
+
+def parse(text: str) -> Almanac:
+
+    almanac = Almanac([], [])
+
+    # Parse input data.
+    for line in text.splitlines():
+
+        # Parse seed list.
+        if line.startswith("seeds"):
+            almanac.seeds = [int(x) for x in line.split(":")[1].split()]
+
+        # Parse lookup tables.
+        elif line:
+            # Start building next lookup table.
+            if line.endswith("map:"):
+                almanac.maps.append([])
+            else:
+                # Append lookup entry to current table.
+                almanac.maps[-1].append(AlmanacRange(*[int(x) for x in line.split(" ")]))
+
+    # Sort almanac ranges, low to high.
+    for almanacRange in almanac.maps:
+        almanacRange.sort(key=lambda r: r.src)
+
+    return almanac
+
+
+def locate(almanac: Almanac, seeds: Sequence[int]) -> tuple[Sequence[int], int]:
+    """ Finds the location of every seed in one batch, and the lowest of them. """
+    locations = almanac.location.batch(seeds)
+    return locations, (int(locations.min()) if np is not None else min(locations))
+
+
+def part1(almanac: Almanac) -> int:
+
+    # Each seed is a single lookup in the composed map.
+    return min(map(almanac.location, almanac.seeds))  # 650599855
+
+
+def part2(almanac: Almanac) -> int:
+
+    # Only the pieces of the composed map that each seed range overlaps are visited.
+    return min(almanac.location.minimum(begin, end) for begin, end in seed_ranges(almanac))  # 1240035
+
+
+def part2_breadth(almanac: Almanac) -> int:
+
+    # Propagate the whole set of seed ranges one stage at a time, the lowest location begins the last set.
+    *_, locations = propagate(almanac, seed_ranges(almanac))
+    return locations[0][0]
+
+
+def part2_reverse(almanac: Almanac) -> int:
+
+    # Search from the lowest locations back to the seeds.
+    return lowest_location(almanac, IntervalSet(seed_ranges(almanac)))
+
+
+def part1_stages(almanac: Almanac) -> int:
+
+    best_location: int | None = None
+
+    # Evaluate each seed to find the best location.
+    for seed in almanac.seeds:
+
+        # Follow the ranges all the way down.
+        location = seed
+        for lookup in almanac.maps:
+            location = find_range(lookup, location)
+
+        # Record the best location.
+        if best_location is None or location < best_location:
+            best_location = location
+
+    return best_location  # 650599855
+
+
+def part2_stages(almanac: Almanac) -> int:
+
+    best_location: int | None = None
+
+    # Search for the best location, following each range down through every map.
+    frontier = deque[tuple[Interval, int]]((seed_range, 0) for seed_range in seed_ranges(almanac))
+    while frontier:
+        query, depth = frontier.pop()
+
+        if depth < len(almanac.maps):
+            for mapped in compute_mapping(almanac.maps[depth], query):
+                frontier.append((mapped, depth + 1))
+
+        # Record the best location (lowest value)
+        elif best_location is None or query.begin < best_location:
+            best_location = query.begin
+
+    return best_location  # 1240035
+
+
+def prepared(text: str) -> Almanac:
+    """ Parses the almanac and composes its map ahead of time. """
+    almanac = parse(text)
+    _ = almanac.location
+    return almanac
+
+
+def bench_seeds() -> array:
+    """ A large batch of seeds spread over the whole domain, for comparing a lookup per seed with a batch. """
+    return array('q', range(0, 1 << 32, 1 << 12))
+
+
+# Alternative implementations, compared by `python -m aoc.bench --variants`.
+# The composed map is built inside each timed run, rather than cached on the parsed almanac.
+VARIANTS = {
+    # The seeds are built with the almanac, when the variant is set up, rather than inside the timed run.
+    "seeds_lookup": lambda text: (lambda a, seeds=bench_seeds(): min(map(a.location, seeds)), prepared(text)),
+    "seeds_batch": lambda text: (lambda a, seeds=bench_seeds(): locate(a, seeds)[1], prepared(text)),
+    "part1_stages": lambda text: (part1_stages, parse(text)),
+    "part1_composed": lambda text: (lambda a: part1(Almanac(a.seeds, a.maps)), parse(text)),
+    "part2_stages": lambda text: (part2_stages, parse(text)),
+    "part2_breadth": lambda text: (lambda a: part2_breadth(Almanac(a.seeds, a.maps)), parse(text)),
+    "part2_composed": lambda text: (lambda a: part2(Almanac(a.seeds, a.maps)), parse(text)),
+    "part2_reverse": lambda text: (lambda a: part2_reverse(Almanac(a.seeds, a.maps)), parse(text)),
+}
+
+
+# ----
+# Parallel mode, for many or very large seed ranges
+# ----
+
+# The almanac of a worker process, sent once when the worker starts rather than with every task.
+worker_almanac: Almanac | None = None
+
+
+def init_worker(almanac: Almanac):
+    global worker_almanac
+    worker_almanac = almanac
+
+    # Build the map of each table once, every task of the worker reuses them.
+    _ = almanac.tables
+
+
+def solve_chunk(part: int, chunk: list[int] | list[tuple[int, int]]) -> int:
+    """
+    The lowest location of a slice of the seeds (part 1), or of a group of seed ranges (part 2).
+    The worker follows its chunk through the tables one stage at a time, nothing is composed.
+    """
+
+    if part == 1:
+        values = chunk
+        for table in worker_almanac.tables:
+            values = table.batch(values)
+        return int(values.min()) if np is not None else min(values)
+
+    *_, locations = propagate(worker_almanac, chunk)
+    return locations[0][0]
+
+
+def split_ranges(ranges: list[Interval], count: int) -> list[list[tuple[int, int]]]:
+    """
+    Deals the ranges into about `count` tasks of similar total size,
+    large ranges are subdivided and consecutive small ranges share a task.
+    """
+
+    size = max(1, -(-sum(r.size for r in ranges) // count))
+
+    tasks = list[list[tuple[int, int]]]()
+    task, room = list[tuple[int, int]](), size
+    for r in ranges:
+        begin = r.begin
+        while begin < r.end:
+            end = min(r.end, begin + room)
+            task.append((begin, end))
+            room -= end - begin
+            begin = end
+
+            # The task is full, start the next.
+            if not room:
+                tasks.append(task)
+                task, room = [], size
+
+    if task:
+        tasks.append(task)
+
+    return tasks
+
+
+def solve_parallel(path: str, part: int, jobs: int | None = None) -> int | None:
+    """
+    Fans the seeds (part 1) or the seed ranges (part 2) out across a pool of processes, keeping the lowest location.
+    Only the parsed tables are sent to the workers, each worker maps its own chunk stage by stage.
+    Without any seeds there is no location, and `None` is returned.
+    """
+
+    jobs = jobs or os.cpu_count() or 1
+
+    with open(path) as file:
+        almanac = parse(file.read())
+
+    if part == 1:
+        size = max(1, -(-len(almanac.seeds) // (jobs * 4)))
+        chunks = [almanac.seeds[i:i + size] for i in range(0, len(almanac.seeds), size)]
+    else:
+        chunks = split_ranges(seed_ranges(almanac), jobs * 4)
+
+    if not chunks:
+        return None
+
+    with ProcessPoolExecutor(jobs, initializer=init_worker, initargs=(almanac,)) as pool:
+        return min(pool.map(solve_chunk, [part] * len(chunks), chunks))
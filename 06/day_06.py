@@ -0,0 +1,112 @@
+# Christopher Chamberlain
+# Advent of Code 2023
+# Day 6
+
+import math
+import re
+from typing import Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, batches fall back to the exact solver per race.
+    np = None
+
+# Races with times below this are solved in int64, the products of the boundary checks stay below 2 ** 62.
+INT64_TIME_LIMIT = 1 << 31
+
+
+def parse(text: str) -> tuple[list[int], list[int]]:
+
+    input = text.splitlines()
+
+    # Parse data
+    times = [int(x) for x in re.split("\\s+", input[0].removeprefix("Time:").strip())]
+    distances = [int(x) for x in re.split("\\s+", input[1].removeprefix("Distance:").strip())]
+
+    return times, distances
+
+
+def count_ways(t: int, d: int) -> int:
+    '''
+    The example states:
+    In the second race, hold for at least 4, at most 11.
+
+    (15 - 3) * 3 = 36
+    (15 - 4) * 4 = 44
+
+    Thus:
+
+    ((t - x) * x) = d
+
+    The winning holds are strictly between the roots of x^2 - tx + d, which are symmetric about t / 2.
+    The integer square root finds the shortest winning hold exactly, at any magnitude.
+    '''
+
+    # Holding for half the time goes furthest, when that does not win no hold does.
+    if (t // 2) * (t - t // 2) <= d:
+        return 0
+
+    # The shortest hold is near the lower root, step onto it exactly.
+    x0 = (t - math.isqrt(t * t - 4 * d)) // 2
+    while x0 * (t - x0) <= d:
+        x0 += 1
+    while x0 > 0 and (x0 - 1) * (t - x0 + 1) > d:
+        x0 -= 1
+
+    # The holds from x0 to t - x0 all win.
+    return t - 2 * x0 + 1
+
+
+def count_ways_batch(times: Sequence[int], distances: Sequence[int]) -> list[int]:
+    """
+    Counts the winning holds of many races at once. Races that fit in int64 estimate their shortest hold
+    with a float square root, then step it until it is exact, the same as `count_ways`.
+    """
+
+    if np is None or not len(times):
+        return [count_ways(t, d) for t, d in zip(times, distances)]
+
+    try:
+        t = np.asarray(times, dtype=np.int64)
+        d = np.asarray(distances, dtype=np.int64)
+    except OverflowError:
+        return [count_ways(t, d) for t, d in zip(times, distances)]
+
+    if t.min() < 0 or t.max() >= INT64_TIME_LIMIT or d.min() < 0:
+        return [count_ways(t, d) for t, d in zip(times, distances)]
+
+    # Only these records can be beaten, holding for half the time goes furthest.
+    winnable = (t // 2) * (t - t // 2) > d
+
+    # Estimate the shortest hold, the float rounding is corrected below.
+    discriminant = np.maximum(t.astype(np.float64) ** 2 - 4 * d.astype(np.float64), 0.0)
+    x0 = np.floor((t - np.sqrt(discriminant)) / 2).astype(np.int64)
+    np.clip(x0, 0, t // 2, out=x0)
+
+    while (short := winnable & (x0 * (t - x0) <= d)).any():
+        x0 += short
+    while (long := winnable & (x0 > 0) & ((x0 - 1) * (t - x0 + 1) > d)).any():
+        x0 -= long
+
+    return np.where(winnable, t - 2 * x0 + 1, 0).tolist()
+
+
+def part1(input: tuple[list[int], list[int]]) -> int:
+    return math.prod(count_ways_batch(*input))  # 2756160
+
+
+def part2(input: tuple[list[int], list[int]]) -> int:
+
+    # The spaces between numbers are to be ignored, yielding a single race.
+    times, distances = input
+    t = int("".join(str(x) for x in times))
+    d = int("".join(str(x) for x in distances))
+
+    return count_ways(t, d)  # 34788142
+
+
+# Alternative implementations, compared by `python -m aoc.bench --variants`.
+VARIANTS = {
+    "races_each": lambda text: (lambda races: [count_ways(t, d) for t, d in zip(*races)], parse(text)),
+    "races_batch": lambda text: (lambda races: count_ways_batch(*races), parse(text)),
+}
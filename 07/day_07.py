@@ -0,0 +1,601 @@
+# Christopher Chamberlain
+# Advent of Code 2023
+# Day 7
+
+import collections
+import heapq
+import itertools
+import operator
+import tempfile
+from array import array
+from dataclasses import dataclass, field
+from enum import IntEnum
+from functools import total_ordering
+from typing import BinaryIO, ClassVar, Iterable, Iterator, List, Sequence
+
+from aoc.loader import load_lines
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the hands are sorted by their packed keys instead.
+    np = None
+
+
+def compare[T](this: T, that: T) -> int:
+    """
+    Compares two comparable values, returning -1, 0, or +1
+    """
+
+    if this == that:
+        return 0
+
+    return -1 if this < that else +1
+
+
+# Card information, lowest to highest.
+CARD_ORDER = ['2', '3', '4', '5', '6', '7', '8', '9', 'T', 'J', 'Q', 'K', 'A']
+JOKER_CARD_ORDER = ['J', '2', '3', '4', '5', '6', '7', '8', '9', 'T', 'Q', 'K', 'A']
+
+
+@total_ordering
+class HandType(IntEnum):
+    HighCard = 0  # 23456 (all unique, highest card scores)
+    OnePair = 1  # A23A4 (two similar)
+    TwoPair = 2  # 23432 (two + two  similar)
+    ThreeOfKind = 3  # TTT98 (three  similar)
+    FullHouse = 4  # 23332 (three + two similar)
+    FourOfKind = 5  # AA8AA (four similar)
+    FiveOfKind = 6  # AAAAA (five similar)
+
+
+def hand_type(top: int, second: int) -> HandType:
+    """ Determines the hand type from the counts of the two most common cards, wildcards joining the first. """
+
+    if top >= 5:
+        return HandType.FiveOfKind
+
+    if top == 4:
+        return HandType.FourOfKind
+
+    if top == 3:
+        return HandType.FullHouse if second >= 2 else HandType.ThreeOfKind
+
+    if top == 2:
+        return HandType.TwoPair if second >= 2 else HandType.OnePair
+
+    return HandType.HighCard
+
+
+def signatures(cards: int, largest: int | None = None) -> Iterator[tuple[int, ...]]:
+    """ Every way of splitting the cards into groups of the same card, largest group first. """
+
+    if cards == 0:
+        yield ()
+        return
+
+    for first in range(min(cards, largest or cards), 0, -1):
+        for rest in signatures(cards - first, first):
+            yield (first, *rest)
+
+
+class Classifier:
+    """
+    Classifies hands through a table from their signature (the counts of each distinct card, largest first)
+    and the number of wildcards to a `HandType`. The table covers every signature of the hand size,
+    and each distinct hand is only counted once, later lookups of the same cards are a single dict lookup.
+    """
+
+    def __init__(self, order: Sequence[str], wildcards: str = '', size: int = 5):
+
+        self.order = order
+        self.index_by_card = {card: index for index, card in enumerate(order)}
+        self.wildcards = wildcards
+        self.size = size
+
+        self.table = dict[tuple[tuple[int, ...], int], HandType]()
+        for wild in range(size + 1):
+            for signature in signatures(size - wild):
+                top = (signature[0] if signature else 0) + wild
+                self.table[signature, wild] = hand_type(top, signature[1] if len(signature) > 1 else 0)
+
+        self.cache = dict[str, HandType]()
+
+    def type(self, cards: str) -> HandType:
+
+        if (known := self.cache.get(cards)) is not None:
+            return known
+
+        if len(cards) != self.size:
+            raise ValueError(f"expected {self.size} cards, got '{cards}'")
+
+        # Count each card, setting the wildcards aside.
+        wild = 0
+        counts = dict[str, int]()
+        for card in cards:
+            if card in self.wildcards:
+                wild += 1
+            else:
+                counts[card] = counts.get(card, 0) + 1
+
+        known = self.cache[cards] = self.table[tuple(sorted(counts.values(), reverse=True)), wild]
+        return known
+
+    def key(self, cards: str) -> int:
+        """
+        Packs the hand into a single integer that orders the hands,
+        the type in the high bits then each card's rank in 4 bits, first card highest.
+        """
+
+        key = int(self.type(cards))
+        for card in cards:
+            key = (key << 4) | self.index_by_card[card]
+
+        return key
+
+
+# The classifier of each part, the second treats (J)okers as wildcards.
+NATURAL = Classifier(CARD_ORDER)
+JOKERS = Classifier(JOKER_CARD_ORDER, wildcards='J')
+
+
+@total_ordering
+@dataclass
+class Hand:
+    cards: List[str]
+    bid: int
+
+    # A -> 12, 2 -> 0
+    index_by_card: ClassVar[dict[str, int]] = NATURAL.index_by_card
+    classifier: ClassVar[Classifier] = NATURAL
+
+    def natural_type(self) -> HandType:
+        """
+        Determines the "natural" hand type, not accounting for Joker subsitution.
+        """
+        return NATURAL.type("".join(self.cards))
+
+    def type(self) -> HandType:
+        return self.classifier.type("".join(self.cards))
+
+    def key(self) -> int:
+        """ Packs the hand into a single integer that orders the same as `compare`. """
+        return self.classifier.key("".join(self.cards))
+
+    def compare(self, that: 'Hand') -> int:
+
+        this_type = self.type()
+        that_type = that.type()
+
+        # Compare types (first priority)
+        if (compare_type := compare(this_type, that_type)) and compare_type != 0:
+            return compare_type
+
+        # Compare cards (secondary priority)
+        for i in range(0, len(self.cards)):
+
+            # Get each card rank
+            this_card = self.index_by_card[self.cards[i]]
+            that_card = self.index_by_card[that.cards[i]]
+
+            if (compare_card := compare(this_card, that_card)) and compare_card != 0:
+                return compare_card
+
+        return 0  # all things appear equal
+
+    def __lt__(self, other: 'Hand') -> bool:
+        return self.compare(other) < 0
+
+    def __eq__(self, other: 'Hand') -> bool:
+        return self.compare(other) == 0
+
+
+@total_ordering
+@dataclass(eq=False)
+class JokerHand(Hand):
+
+    # A -> 12, J -> 0
+    index_by_card: ClassVar[dict[str, int]] = JOKERS.index_by_card
+
+    # Accounts for Joker substitution, the (J)okers join the card we have the most of.
+    classifier: ClassVar[Classifier] = JOKERS
+
+
+class Hands:
+    """
+    The hands in columns, the cards of every hand back to back (`size` bytes each) and their bids.
+    A hand costs its cards and one machine word, iterating produces `(cards, bid)` pairs on demand.
+    """
+
+    def __init__(self):
+        self.size = 0
+        self.cards = bytearray()
+        self.bids = array('q')
+
+    def append(self, cards: bytes, bid: int):
+
+        if not self.bids:
+            self.size = len(cards)
+        elif len(cards) != self.size:
+            raise ValueError(f"expected {self.size} cards, got {cards!r}")
+
+        self.cards += cards
+        self.bids.append(bid)
+
+    def __len__(self) -> int:
+        return len(self.bids)
+
+    def __iter__(self) -> Iterator[tuple[str, int]]:
+        size = self.size
+        for i, bid in enumerate(self.bids):
+            yield self.cards[i * size:(i + 1) * size].decode('ascii'), bid
+
+
+def parse(text: str) -> Hands:
+
+    # Parse input data.
+    hands = Hands()
+    for line in text.encode('ascii').splitlines():
+        cards, bid = line.split(b' ')
+        hands.append(cards, int(bid))
+
+    return hands
+
+
+def load(path: str) -> Hands:
+
+    # Read the hands from the memory mapped file one line at a time, only their cards and bids are kept.
+    hands = Hands()
+    for line in load_lines(path):
+        cards, bid = line.split(b' ')
+        hands.append(cards, int(bid))
+
+    return hands
+
+
+def total_winnings(hands: list[Hand]) -> int:
+
+    # Sort the hands, each hand's type is determined once when packing its key.
+    hands.sort(key=lambda hand: hand.key())
+
+    # Accumulate score in rank order.
+    score = 0
+    for rank, hand in enumerate(hands):
+        score += (rank + 1) * hand.bid
+
+    return score
+
+
+def encode(hands: Hands, classifier: Classifier = NATURAL) -> tuple['np.ndarray', 'np.ndarray']:
+    """
+    Encodes the hands as one row of digits each, the type followed by the rank of each card,
+    so sorting the rows by their digits (first digit most significant) orders the hands.
+    No per-hand objects are made, the cards of every hand are classified together straight from the columns.
+    """
+
+    order, size = classifier.order, classifier.size
+    if hands.size != size:
+        raise ValueError(f"expected hands of {size} cards, got {hands.size}")
+
+    # Translate every card to its rank at once.
+    table = bytearray(256)
+    for rank, card in enumerate(order):
+        table[ord(card)] = rank
+
+    cards = hands.cards.translate(table)
+    ranks = np.frombuffer(cards, np.uint8).reshape(len(hands), size)
+
+    # Count each rank in each hand with one flat histogram, then set the wildcards aside.
+    cells = (np.arange(len(hands)) * len(order))[:, None] + ranks
+    counts = np.bincount(cells.ravel(), minlength=len(hands) * len(order)).astype(np.uint8).reshape(len(hands), -1)
+
+    wildcards = [classifier.index_by_card[card] for card in classifier.wildcards]
+    wild = counts[:, wildcards].sum(axis=1, dtype=np.uint8)
+    counts[:, wildcards] = 0
+
+    # The wildcards join the most common card.
+    counts.sort(axis=1)
+    top, second = counts[:, -1] + wild, counts[:, -2]
+
+    # The same rule as the classifier, tabled by the counts of the two most common cards.
+    types = np.array([hand_type(t, s) for t in range(size + 1) for s in range(size + 1)], np.uint8)
+
+    digits = np.empty((len(hands), size + 1), np.uint8)
+    digits[:, 0] = types[top.astype(np.intp) * (size + 1) + second]
+    digits[:, 1:] = ranks
+
+    return digits, np.frombuffer(hands.bids, np.int64)
+
+
+def radix_order(digits: 'np.ndarray') -> 'np.ndarray':
+    """
+    Orders the rows with an LSD radix sort, one stable pass per digit from the least significant.
+    Each digit is a single byte, which NumPy's stable sort handles with a counting (radix) sort.
+    """
+
+    order = np.arange(len(digits))
+    for column in reversed(range(digits.shape[1])):
+        order = order[np.argsort(digits[order, column], kind='stable')]
+
+    return order
+
+
+def rank_winnings(hands: Hands, classifier: Classifier = NATURAL) -> int:
+    """
+    Ranks the hands in linear time, the winnings are then the dot product of the ranks and the bids.
+    Without NumPy the hands are sorted by their packed keys instead, the same order as `total_winnings`.
+    """
+
+    if not hands:
+        return 0
+
+    if np is None:
+        ranked = sorted(hands, key=lambda hand: classifier.key(hand[0]))
+        return sum(rank * bid for rank, (_, bid) in enumerate(ranked, 1))
+
+    digits, bids = encode(hands, classifier)
+    ranks = np.arange(1, len(hands) + 1, dtype=np.int64)
+    return int(ranks @ bids[radix_order(digits)])
+
+
+def part1(input: Hands) -> int:
+    return rank_winnings(input)  # 248396258
+
+
+def part2(input: Hands) -> int:
+    return rank_winnings(input, JOKERS)  # 246436046
+
+
+# ----
+# External merge sort, for hand files larger than memory
+# ----
+
+
+def spill_run(records: list[tuple[int, int]]) -> BinaryIO:
+    """ Sorts the (key, bid) records and writes them to a temporary file, deleted once it is closed. """
+
+    records.sort(key=operator.itemgetter(0))
+
+    file = tempfile.TemporaryFile()
+    array('q', itertools.chain.from_iterable(records)).tofile(file)
+    file.seek(0)
+
+    return file
+
+
+def read_run(file: BinaryIO, block: int = 1 << 14) -> Iterator[tuple[int, int]]:
+    """ Reads a sorted run back as (key, bid) records, `block` records at a time straight into one array. """
+
+    while True:
+        values = array('q')
+        try:
+            values.fromfile(file, 2 * block)
+        except EOFError:  # the last block is short
+            pass
+
+        if not values:
+            return
+
+        for i in range(0, len(values), 2):
+            yield values[i], values[i + 1]
+
+
+def external_winnings(lines: Iterable[bytes], classifier: Classifier = NATURAL, chunk: int = 1 << 20) -> int:
+    """
+    Ranks the hands with an external merge sort, holding at most `chunk` hands in memory at a time.
+    The hands are read in chunks, each chunk is sorted by packed key and spilled to a temporary file,
+    then the runs are merged and the winnings are accumulated as the hands come out in rank order.
+    The merge shares the same budget between the runs, so its buffers hold about `chunk` records however many runs there are.
+    """
+
+    lines = iter(lines)
+
+    runs = list[BinaryIO]()
+    try:
+        while hands := list(itertools.islice(lines, chunk)):
+            records = list[tuple[int, int]]()
+            for line in hands:
+                cards, bid = line.split(b' ')
+                records.append((classifier.key(cards.decode('ascii')), int(bid)))
+            runs.append(spill_run(records))
+
+        # Both sorts are stable, and the runs are merged in the order they were read, so equal hands keep their order.
+        block = max(1, chunk // max(1, len(runs)))
+        merged = heapq.merge(*(read_run(run, block) for run in runs), key=operator.itemgetter(0))
+        return sum(rank * bid for rank, (_, bid) in enumerate(merged, 1))
+
+    finally:
+        for run in runs:
+            run.close()
+
+
+def solve_stream(path: str, part: int) -> int:
+
+    # Sort the memory mapped hands in bounded chunks, then merge the sorted runs.
+    return external_winnings(load_lines(path), NATURAL if part == 1 else JOKERS)
+
+
+# ----
+# Online ranking, for a continuous feed of hands
+# ----
+
+
+class Fenwick:
+    """
+    A Fenwick (binary indexed) tree of integers, updating a value and summing a prefix in O(log n).
+    The nodes are allocated when first touched, and the size doubles whenever a value lands beyond it.
+    """
+
+    __slots__ = ("size", "tree")
+
+    def __init__(self, size: int = 1):
+
+        # A power of two, so doubling only adds the node covering the whole tree.
+        self.size = 1 << (size - 1).bit_length()
+        self.tree = dict[int, int]()
+
+    def add(self, index: int, delta: int):
+
+        tree = self.tree
+        while index >= self.size:
+            tree[2 * self.size] = self.prefix(self.size)
+            self.size *= 2
+
+        index += 1
+        while index <= self.size:
+            tree[index] = tree.get(index, 0) + delta
+            index += index & -index
+
+    def prefix(self, end: int) -> int:
+        """ The sum of the values before `end`. """
+
+        tree = self.tree
+        total = 0
+        end = min(end, self.size)
+        while end > 0:
+            total += tree.get(end, 0)
+            end -= end & -end
+
+        return total
+
+
+@dataclass(slots=True)
+class Arrivals:
+    """
+    The live hands of one key in insertion order, counted and their bids summed by position.
+    Once the removed hands outnumber the live ones, the live hands are renumbered from zero,
+    so the trees stay proportional to the live hands rather than to every hand ever inserted.
+    """
+
+    counts: Fenwick = field(default_factory=Fenwick)
+    bids: Fenwick = field(default_factory=Fenwick)
+
+    # The positions of the live hands with each bid, earliest first.
+    positions: dict[int, collections.deque[int]] = field(default_factory=dict)
+
+    inserted: int = 0
+    live: int = 0
+
+    def append(self, bid: int) -> int:
+        """ Adds the latest hand, returning its position. """
+
+        position = self.inserted
+        self.inserted += 1
+        self.live += 1
+
+        self.counts.add(position, 1)
+        self.bids.add(position, bid)
+        self.positions.setdefault(bid, collections.deque()).append(position)
+
+        return position
+
+    def pop(self, bid: int) -> int:
+        """ Removes the earliest hand with the bid, returning its position. """
+
+        positions = self.positions[bid]
+        position = positions.popleft()
+        if not positions:
+            del self.positions[bid]
+
+        self.live -= 1
+        self.counts.add(position, -1)
+        self.bids.add(position, -bid)
+
+        return position
+
+    def compact(self):
+        """ Renumbers the live hands from zero in the same order, dropping the positions of removed hands. """
+
+        order = sorted((position, bid) for bid, positions in self.positions.items() for position in positions)
+
+        self.counts, self.bids, self.positions = Fenwick(len(order)), Fenwick(len(order)), {}
+        self.inserted = self.live = 0
+        for _, bid in order:
+            self.append(bid)
+
+
+class Ranking:
+    """
+    Keeps the total winnings of a changing set of hands, inserting or removing a hand in O(log n).
+
+    Two Fenwick trees over the packed keys count the hands and sum the bids below any key, and the hands
+    of each key keep another two over their insertion order, so equal hands are ranked in the order they
+    were inserted, the same as the other engines. The trees only allocate the nodes they touch, so any hand
+    size works, and a key is dropped once its last hand is removed. Inserting a hand ranks it after every
+    lower hand, and moves every higher hand up one rank, adding their bids once more.
+    """
+
+    def __init__(self, classifier: Classifier = NATURAL):
+
+        self.classifier = classifier
+        self.space = len(HandType) << (4 * classifier.size)
+
+        self.counts = Fenwick(self.space)
+        self.bids = Fenwick(self.space)
+        self.arrivals = dict[int, Arrivals]()
+
+        self.bid_total = 0
+        self.total = 0
+
+    def insert(self, cards: str, bid: int) -> int:
+        """ Adds a hand, returning the new total winnings. """
+
+        key = self.classifier.key(cards)
+
+        # The hand is the latest of its key, so it ranks after every equal hand.
+        rank = self.counts.prefix(key + 1) + 1
+        above = self.bid_total - self.bids.prefix(key + 1)
+        self.total += rank * bid + above
+
+        self.arrivals.setdefault(key, Arrivals()).append(bid)
+        self.counts.add(key, 1)
+        self.bids.add(key, bid)
+        self.bid_total += bid
+
+        return self.total
+
+    def remove(self, cards: str, bid: int) -> int:
+        """ Removes a hand (the earliest inserted, if it was inserted more than once), returning the new total winnings. """
+
+        key = self.classifier.key(cards)
+        if (arrivals := self.arrivals.get(key)) is None or bid not in arrivals.positions:
+            raise KeyError(f"no hand '{cards}' with bid {bid}")
+
+        position = arrivals.pop(bid)
+
+        # Ranked after the lower hands and the equal hands inserted before it, below the rest.
+        rank = self.counts.prefix(key) + arrivals.counts.prefix(position) + 1
+        later = arrivals.bids.prefix(arrivals.inserted) - arrivals.bids.prefix(position)
+        above = self.bid_total - self.bids.prefix(key + 1) + later
+        self.total -= rank * bid + above
+
+        if not arrivals.live:
+            del self.arrivals[key]
+        elif arrivals.inserted > 2 * arrivals.live:
+            arrivals.compact()
+
+        self.counts.add(key, -1)
+        self.bids.add(key, -bid)
+        self.bid_total -= bid
+
+        return self.total
+
+    def __len__(self) -> int:
+        return self.counts.prefix(self.space)
+
+
+def running_totals(hands: Iterable[tuple[str, int]], classifier: Classifier = NATURAL) -> Iterator[int]:
+    """ Yields the total winnings after each hand arrives, without ranking the hands again. """
+
+    ranking = Ranking(classifier)
+    for cards, bid in hands:
+        yield ranking.insert(cards, bid)
+
+
+# Alternative implementations, compared by `python -m aoc.bench --variants`.
+VARIANTS = {
+    "part1_objects": lambda text: (lambda hands: total_winnings([Hand(list(c), b) for c, b in hands]), parse(text)),
+    "part1_radix": lambda text: (rank_winnings, parse(text)),
+    "part2_objects": lambda text: (lambda hands: total_winnings([JokerHand(list(c), b) for c, b in hands]), parse(text)),
+    "part2_radix": lambda text: (lambda hands: rank_winnings(hands, JOKERS), parse(text)),
+    "part2_online": lambda text: (lambda hands: collections.deque(running_totals(hands, JOKERS), 1)[0], parse(text)),
+}
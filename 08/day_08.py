@@ -1,6 +1,6 @@
 # Christopher Chamberlain
 # Advent of Code 2023
-# Day 8.2
+# Day 8
 
 import math
 import re
@@ -17,46 +17,47 @@ class Node:
     right: str
 
 
-# Read input data
-with open("day_08_input.txt", encoding='utf-8') as file:
-    input = deque(file.read().splitlines())
+@dataclass
+class Map:
+    instructions: list[str]
+    network: dict[str, Node]
+
+
+def parse(text: str) -> Map:
 
-# Parse LR instructions
-instructions = list(input.popleft())
-input.popleft()  # skip blank
+    input = deque(text.splitlines())
 
-# Parse network
-network = dict[str, Node]()
-while input and (match := NODE_REGEX.match(input.popleft())):
-    X, L, R = match.groups([1, 2, 3])
-    network[X] = Node(X, L, R)
+    # Parse LR instructions
+    instructions = list(input.popleft())
+    input.popleft()  # skip blank
 
+    # Parse network
+    network = dict[str, Node]()
+    while input and (match := NODE_REGEX.match(input.popleft())):
+        X, L, R = match.groups([1, 2, 3])
+        network[X] = Node(X, L, R)
 
-def count_steps(start: Node):
+    return Map(instructions, network)
 
-    global instructions
-    global network
+
+def count_steps(map: Map, start: Node, is_end=lambda name: name.endswith('Z')) -> int:
 
     # ...
-    instruction_queue = deque(instructions)
+    instruction_queue = deque(map.instructions)
     current_node = start
 
     steps = 0
-    path = [start.name]
 
     # Walk the network from 'A' to 'Z'
     while instruction_queue and (instruction := instruction_queue.popleft()):
 
         # ...
         next_identifier = current_node.left if instruction == 'L' else current_node.right
-        current_node = network[next_identifier]
-
-        # ...
-        path.append(current_node.name)
+        current_node = map.network[next_identifier]
         steps += 1
 
         # ...
-        if next_identifier.endswith('Z'):
+        if is_end(next_identifier):
             break
 
         # To avoid running out of instructions, populate put on end of deque.
@@ -64,6 +65,10 @@ def count_steps(start: Node):
 
     return steps
 
+
+def part1(map: Map) -> int:
+    return count_steps(map, map.network['AAA'], lambda name: name == 'ZZZ')  # 19631
+
 # Careful observation of the input data shows all starting nodes produce cycles of exactly the instruction length.
 # Which means we can compute the LCM of the lengths of the cycles to compute the total number of steps.
 #
@@ -81,17 +86,19 @@ def count_steps(start: Node):
 #
 
 
-# Gather the starting nodes.
-starting_nodes = [network[k] for k in network.keys() if k.endswith("A")]
+def part2(map: Map) -> int:
+
+    # Gather the starting nodes.
+    starting_nodes = [map.network[k] for k in map.network.keys() if k.endswith("A")]
 
-# Compute the length of each cycle.
-path_lengths = list[int]()
-for node in starting_nodes:
-    path_lengths.append(count_steps(node))
+    # Compute the length of each cycle.
+    path_lengths = list[int]()
+    for node in starting_nodes:
+        path_lengths.append(count_steps(map, node))
 
-# Compute the least common multiple of these cycles.
-lcm = 1
-for i in path_lengths:
-    lcm = lcm * i // math.gcd(lcm, i)
+    # Compute the least common multiple of these cycles.
+    lcm = 1
+    for i in path_lengths:
+        lcm = lcm * i // math.gcd(lcm, i)
 
-print(lcm)  # 21003205388413
+    return lcm  # 21003205388413
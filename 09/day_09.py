@@ -0,0 +1,65 @@
+# Christopher Chamberlain
+# Advent of Code 2023
+# Day 9
+
+
+def compute_derivative(values: list[int]) -> list[int]:
+    output = []
+
+    for i in range(1, len(values)):
+        output.append(values[i] - values[i - 1])
+
+    return output
+
+
+def compute_derivatives(values: list[int]) -> list[list[int]]:
+
+    derivatives = list[list[int]]()
+    derivatives.append(values)
+
+    while any(derivatives[-1]):
+        derivatives.append(compute_derivative(derivatives[-1]))
+
+    return derivatives
+
+
+def extrapolate(values: list[int]) -> int:
+
+    derivatives = compute_derivatives(values)
+
+    advance = 0
+    for i in range(len(derivatives) - 1, 0, -1):
+        advance += derivatives[i][-1]
+
+    return values[-1] + advance
+
+
+def extrapolate_backwards(values: list[int]) -> int:
+
+    derivatives = compute_derivatives(values)
+
+    C = 0
+
+    for i in range(len(derivatives) - 1, 0, -1):
+
+        B = derivatives[i][0]
+        A = B - C
+        C = A
+
+    return values[0] - C
+
+
+def parse(text: str) -> list[list[int]]:
+    return [[int(x) for x in line.split(' ')] for line in text.splitlines()]
+
+
+def part1(input: list[list[int]]) -> int:
+
+    # Predict next value.
+    return sum(extrapolate(values) for values in input)  # 2043677056
+
+
+def part2(input: list[list[int]]) -> int:
+
+    # Predict previous value.
+    return sum(extrapolate_backwards(values) for values in input)  # 1062
@@ -0,0 +1,294 @@
+# Christopher Chamberlain
+# Advent of Code 2023
+# Day 10
+
+from collections import deque
+from dataclasses import dataclass
+from enum import IntEnum
+
+from aoc.grid import Grid
+from aoc.loader import load_grid
+
+ANIM_STEPS = 1000
+
+
+class Category(IntEnum):
+    Unknown = 0
+    Loop = 1
+    LoopWalk = 2
+    Inside = 3
+    Outside = 4
+
+
+class Ansi:
+
+    BLACK = "\033[0;30m"
+    RED = "\033[0;31m"
+    GREEN = "\033[0;32m"
+    YELLOW = "\033[0;33m"
+    BLUE = "\033[0;34m"
+    PURPLE = "\033[0;35m"
+    CYAN = "\033[0;36m"
+    LIGHT_GRAY = "\033[0;37m"
+
+    DARK_GRAY = "\033[1;30m"
+    LIGHT_RED = "\033[1;31m"
+    LIGHT_GREEN = "\033[1;32m"
+    LIGHT_YELLOW = "\033[1;33m"
+    LIGHT_BLUE = "\033[1;34m"
+    LIGHT_PURPLE = "\033[1;35m"
+    LIGHT_CYAN = "\033[1;36m"
+    WHITE = "\033[1;37m"
+
+    def RGB(r: int, g: int, b: int): return f"\033[38;2;{r};{g};{b}m"
+    def BACKGROUND_RGB(r: int, g: int, b: int): return f"\033[48;2;{r};{g};{b}m"
+
+    RESET_COLORS = "\033[0m"
+
+    def SET_CURSOR(x: int, y: int): return f"\033[{y};{x}H"
+    SAVE_CURSOR = f"\0337"
+    RESTORE_CURSOR = f"\0338"
+
+    HIDE_CURSOR = f"\033[?25l"
+    SHOW_CURSOR = f"\033[?25h"
+
+    ERASE_SCREEN = "\033[2J"
+    ERASE_TO_BOTTOM = "\033[0J"
+    ERASE_TO_TOP = "\033[1J"
+    ERASE_LINE = "\033[2K"
+
+    CLEAR_SCREEN = "\033[3J"
+
+
+# Directions are numbered (up, right, down, left), matching the order of `Grid.neighbors4`.
+@dataclass
+class PipeInfo:
+
+    character: str
+    glyph: str
+    connections: list[list[str]]
+    neighbors: list[int]
+    neighbors_edge: list[int]
+
+
+# The allowable symbols for connection in each direction.
+T_CONNECTIONS = ['|', '7', 'F']
+C_CONNECTIONS = ['-', '7', 'J']
+B_CONNECTIONS = ['|', 'L', 'J']
+L_CONNECTIONS = ['-', 'F', 'L']
+
+# The table of information for each pipe tile.
+PIPE_TABLE = {p.character: p for p in [
+    # ...
+    PipeInfo('|', '│', [T_CONNECTIONS, [], B_CONNECTIONS, []], [0, 2], [1, 3]),
+    PipeInfo('-', '─', [[], C_CONNECTIONS, [], L_CONNECTIONS], [1, 3], [0, 2]),
+    PipeInfo('L', '└', [T_CONNECTIONS, C_CONNECTIONS, [], []], [0, 1], [2, 3]),
+    PipeInfo('7', '┐', [[], [], B_CONNECTIONS, L_CONNECTIONS], [2, 3], [0, 1]),
+    PipeInfo('F', '┌', [[], C_CONNECTIONS, B_CONNECTIONS, []], [1, 2], [0, 3]),
+    PipeInfo('J', '┘', [T_CONNECTIONS, [], [], L_CONNECTIONS], [0, 3], [1, 2]),
+    # ...
+    PipeInfo('.', '•', [[], [], [], []], [], []),
+    PipeInfo('S', 'S', [[], [], [], []], [], []),
+]}
+
+# The same table, indexed by the byte stored in the grid.
+PIPE_BY_BYTE: list[PipeInfo] = [PIPE_TABLE['.']] * 256
+for pipe in PIPE_TABLE.values():
+    PIPE_BY_BYTE[ord(pipe.character)] = pipe
+
+
+@dataclass
+class Maze:
+    grid: Grid
+    start: int
+
+
+def draw_pipes(maze: Maze, categories: Grid):
+
+    screen_buffer = ""
+    screen_buffer += Ansi.SET_CURSOR(0, 0)
+
+    # Parse input data.
+    for y in range(0, maze.grid.height):
+        for x in range(0, maze.grid.width):
+
+            match categories.get(x, y):
+                case Category.Loop:
+                    screen_buffer += Ansi.BLUE
+                case Category.LoopWalk:
+                    screen_buffer += Ansi.WHITE
+                case Category.Inside:
+                    screen_buffer += Ansi.GREEN
+                case Category.Outside:
+                    screen_buffer += Ansi.RED
+                case Category.Unknown:
+                    screen_buffer += Ansi.YELLOW
+                case _:
+                    screen_buffer += Ansi.DARK_GRAY
+
+            screen_buffer += PIPE_BY_BYTE[maze.grid.get(x, y)].glyph
+        screen_buffer += "\n"
+
+    screen_buffer += Ansi.RESET_COLORS
+    print(screen_buffer.strip())
+
+
+def parse(text: str) -> Maze:
+
+    # Populate pipe grid, the border is empty ground.
+    return build_maze(Grid.from_lines(text.splitlines(), border=ord('.')))
+
+
+def load(path: str) -> Maze:
+
+    # Copy the memory mapped pipes straight into the grid, without decoding each line.
+    return build_maze(load_grid(path, border=ord('.')))
+
+
+def build_maze(grid: Grid) -> Maze:
+
+    # Find starting position.
+    start = grid.find(ord('S'))
+    assert start >= 0
+
+    # First figure out the starting pipe, by evaluating connectivity with its neighbors.
+    common = set(PIPE_TABLE.keys())
+    for direction, offset in enumerate(grid.neighbors4):
+        i_opposite = (direction + 2) % 4
+        if (pipe := PIPE_BY_BYTE[grid[start + offset]]) and pipe.connections[i_opposite]:
+            common.intersection_update(pipe.connections[i_opposite])
+
+    assert len(common) == 1
+
+    # Replace the start pipe with the correct pipe tile.
+    grid[start] = ord(list(common)[0])
+
+    return Maze(grid, start)
+
+
+def part1(maze: Maze, animate: bool = False) -> int:
+
+    grid = maze.grid
+    offsets = grid.neighbors4
+
+    # Tiles connected to the loop so far.
+    visited = Grid(grid.width, grid.height, fill=0, border=0)
+    visited[maze.start] = Category.Loop
+
+    largest: int = 0
+    iteration: int = 0
+
+    # We will begin evaluating the connectivity from the starting position.
+    queue = deque[tuple[int, int]]()
+    queue.append((maze.start, 0))
+
+    # Find the tiles connected to the "loop" with an expanding frontier.
+    while queue:
+        index, distance = queue.pop()
+
+        # The frontier expands in order of distance.
+        largest = distance
+
+        # For each neighboring position.
+        for n in PIPE_BY_BYTE[grid[index]].neighbors:
+
+            # Compute neighbor position.
+            n_index = index + offsets[n]
+
+            if not visited[n_index]:
+                queue.appendleft((n_index, distance + 1))
+                visited[n_index] = Category.Loop
+
+        # Display the pipe network each few steps.
+        if animate and iteration % ANIM_STEPS == 0:
+            draw_pipes(maze, visited)
+
+        iteration += 1
+
+    # The largest distance is the answer.
+    return largest  # 6909
+
+
+def part2(maze: Maze, animate: bool = False) -> int:
+
+    grid = maze.grid
+    offsets = grid.neighbors4
+    direction_by_offset = {offset: direction for direction, offset in enumerate(offsets)}
+
+    # The category of each tile, every tile is unknown until shown otherwise.
+    # The border is marked as part of the loop, so it is never flooded.
+    categories = Grid(grid.width, grid.height, fill=Category.Unknown, border=Category.Loop)
+    cells = categories.cells
+
+    # The looping pipe path.
+    path = list[int]()
+
+    # We will begin evaluating the connectivity from the starting position.
+    frontier = list[int]()
+    frontier.append(maze.start)
+    cells[maze.start] = Category.Loop
+
+    # Find the tiles connected to the "loop" with an expanding frontier.
+    while frontier:
+        index = frontier.pop()
+        path.append(index)
+
+        # For each neighboring position.
+        for n in PIPE_BY_BYTE[grid[index]].neighbors:
+
+            # Compute neighbor position, marking it as visited.
+            if cells[n_index := index + offsets[n]] != Category.Loop:
+                frontier.append(n_index)
+                cells[n_index] = Category.Loop
+
+            if animate and len(path) % ANIM_STEPS == 0:
+                draw_pipes(maze, categories)
+
+    def flood(index: int, category: Category):
+
+        queue = deque[int]()
+        queue.append(index)
+
+        while queue:
+            index = queue.pop()
+
+            # Assign category.
+            cells[index] = category
+
+            # Submit Unknown neighbors.
+            for offset in offsets:
+                if cells[n_index := index + offset] == Category.Unknown:
+                    cells[n_index] = category
+                    queue.appendleft(n_index)
+
+    # Walks along "outside wall" and marks each neighbor as either 'inside' or 'outside'.
+    # Note: Inside and Outside may not actually be true inside and outside,
+    # however, they do correctly classify each side of the loop.
+    for step, index in enumerate(path):
+        cells[index] = Category.LoopWalk
+
+        # Compute directions for current and next steps.
+        direction_curr = direction_by_offset[index - path[step - 1]]
+        direction_next = direction_by_offset[path[(step + 1) % len(path)] - index]
+
+        # Compute perpendiculars (rotating counter-clockwise and clockwise)...
+        perp1 = (direction_curr + 3) % 4
+        perp2 = (direction_curr + 1) % 4
+
+        # ...
+        if animate and step % ANIM_STEPS == 0:
+            draw_pipes(maze, categories)
+
+        # Mark the perpendicular edges along the path as "inside" or "outside"
+        for n in PIPE_BY_BYTE[grid[index]].neighbors_edge:
+            n_index = index + offsets[n]
+            if cells[n_index] == Category.Unknown:
+                is_outside = n == perp2 or direction_next == perp1
+                flood(n_index, Category.Outside if is_outside else Category.Inside)
+
+    # Display final frame.
+    if animate:
+        draw_pipes(maze, categories)
+
+    # Count how many inside tiles we have.
+    return cells.count(Category.Inside)  # 5321
@@ -0,0 +1,17 @@
+# Christopher Chamberlain
+# Advent of Code 2023
+# Shared tooling
+
+"""
+Shared tooling for the daily solvers.
+
+Each day lives in `NN/day_NN.py` and exposes `parse(text)`, `part1(parsed)` and `part2(parsed)`.
+Run any subset of days with `python -m aoc [days...] [--input PATH]`.
+
+Synthetic inputs of any size are written with `python -m aoc.generators DAY SIZE`,
+and `python -m aoc.bench [days...]` reports how each solver scales with them.
+"""
+
+from aoc.runner import load_day, run_day
+
+__all__ = ["load_day", "run_day"]
@@ -0,0 +1,9 @@
+# Christopher Chamberlain
+# Advent of Code 2023
+# Runner entry point
+
+import sys
+
+from aoc.runner import main
+
+sys.exit(main())
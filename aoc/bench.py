@@ -0,0 +1,218 @@
+# Christopher Chamberlain
+# Advent of Code 2023
+# Scaling benchmarks
+
+import argparse
+import gc
+import math
+import sys
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any
+
+from aoc.generators import GENERATORS, generate_text
+from aoc.runner import load_day, timed
+
+# Default sizes for each day, these are lines, cards, hands, etc. (grid side length for days 3 and 10).
+DEFAULT_SIZES: dict[int, list[int]] = {
+    1: [1_000, 10_000, 100_000],
+    2: [1_000, 10_000, 100_000],
+    3: [70, 140, 280, 560],
+    4: [1_000, 10_000, 100_000],
+    5: [10, 100, 1_000],
+    6: [10, 100, 1_000],
+    7: [1_000, 10_000, 100_000],
+    8: [1_000, 10_000, 100_000],
+    9: [1_000, 10_000, 100_000],
+    10: [35, 70, 140, 280],
+}
+
+STEPS = ["parse", "part1", "part2"]
+
+
+@dataclass
+class Sample:
+    size: int
+    bytes: int
+    seconds: dict[str, float] = field(default_factory=dict)
+    peak: dict[str, int] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+
+
+def run_steps(module: Any, text: str, trace: bool) -> tuple[dict[str, float], dict[str, int], dict[str, str]]:
+    """
+    Runs parse and both parts, recording the wall time and (when tracing) the peak allocated memory of each step.
+    The peak of each part includes the parsed input it was given.
+    """
+
+    seconds = dict[str, float]()
+    peak = dict[str, int]()
+    errors = dict[str, str]()
+
+    gc.collect()
+    if trace:
+        tracemalloc.start()
+
+    try:
+        parsed = None
+        for step in STEPS:
+
+            if trace:
+                tracemalloc.reset_peak()
+
+            try:
+                if step == "parse":
+                    parsed, seconds[step] = timed(module.parse, text)
+                elif parsed is not None:
+                    _, seconds[step] = timed(getattr(module, step), parsed)
+            except Exception as error:
+                errors[step] = type(error).__name__
+
+            if trace:
+                peak[step] = tracemalloc.get_traced_memory()[1]
+
+    finally:
+        if trace:
+            tracemalloc.stop()
+
+    return seconds, peak, errors
+
+
+def bench_day(day: int, sizes: list[int], seed: int = 0, memory: bool = True, repeat: int = 1) -> list[Sample]:
+    """
+    Benchmarks a day across input sizes, keeping the best time of each step over the repeats.
+    Memory is measured in a separate run, as tracing allocations distorts the timings.
+    """
+
+    module = load_day(day)
+
+    samples = list[Sample]()
+    for size in sizes:
+
+        text = generate_text(day, size, seed)
+        sample = Sample(size, len(text))
+
+        for _ in range(repeat):
+            seconds, _, errors = run_steps(module, text, trace=False)
+            sample.errors.update(errors)
+            for step, value in seconds.items():
+                sample.seconds[step] = min(value, sample.seconds.get(step, math.inf))
+
+        if memory:
+            _, sample.peak, _ = run_steps(module, text, trace=True)
+
+        samples.append(sample)
+
+    return samples
+
+
+def bench_variants(day: int, sizes: list[int], seed: int = 0, repeat: int = 1) -> tuple[list[str], list[Sample]]:
+    """
+    Benchmarks the alternative implementations a day declares in `VARIANTS`, keeping the best time over the repeats.
+    Each variant prepares its input (untimed) from the text, then only the solve is timed.
+    """
+
+    variants = load_day(day).VARIANTS
+
+    samples = list[Sample]()
+    for size in sizes:
+
+        text = generate_text(day, size, seed)
+        sample = Sample(size, len(text))
+
+        for name, prepare in variants.items():
+            try:
+                function, argument = prepare(text)
+                for _ in range(repeat):
+                    gc.collect()
+                    _, seconds = timed(function, argument)
+                    sample.seconds[name] = min(seconds, sample.seconds.get(name, math.inf))
+            except Exception as error:
+                sample.errors[name] = type(error).__name__
+
+        samples.append(sample)
+
+    return list(variants), samples
+
+
+def scaling_exponent(a: Sample, b: Sample, step: str) -> float | None:
+    """
+    Estimates k in `time ~ bytes ^ k` between two samples.
+    Roughly 1 is linear in the input size, 2 is quadratic.
+    """
+
+    if step not in a.seconds or step not in b.seconds or a.bytes == b.bytes:
+        return None
+
+    if a.seconds[step] <= 0 or b.seconds[step] <= 0:
+        return None
+
+    return math.log(b.seconds[step] / a.seconds[step]) / math.log(b.bytes / a.bytes)
+
+
+def format_samples(day: int, samples: list[Sample], memory: bool, steps: list[str] = STEPS) -> str:
+
+    width = max(12, *(len(step) + 3 for step in steps))
+
+    header = f"{'size':>10} {'bytes':>12}"
+    for step in steps:
+        header += f" {step + ' ms':>{width}} {'k':>5}"
+        if memory:
+            header += f" {'peak MiB':>9}"
+
+    lines = [f"Day {day:02}", header]
+    for index, sample in enumerate(samples):
+
+        line = f"{sample.size:>10} {sample.bytes:>12}"
+        for step in steps:
+
+            if step in sample.errors:
+                line += f" {sample.errors[step]:>{width + 6}}"
+            elif step in sample.seconds:
+                exponent = scaling_exponent(samples[index - 1], sample, step) if index > 0 else None
+                line += f" {sample.seconds[step] * 1000:>{width}.3f}"
+                line += f" {exponent:>5.2f}" if exponent is not None else f" {'':>5}"
+            else:
+                line += f" {'-':>{width + 6}}"
+
+            if memory:
+                line += f" {sample.peak[step] / (1 << 20):>9.2f}" if step in sample.peak else f" {'':>9}"
+
+        lines.append(line)
+
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+
+    parser = argparse.ArgumentParser(
+        prog="aoc.bench",
+        description="Runs each solver across synthetic inputs of growing size. "
+                    "The 'k' column estimates the scaling exponent, time ~ bytes ^ k.")
+    parser.add_argument("days", nargs="*", type=int, help="days to benchmark (default: all)")
+    parser.add_argument("-n", "--sizes", nargs="+", type=int, help="input sizes (default: per day)")
+    parser.add_argument("-s", "--seed", type=int, default=0)
+    parser.add_argument("-r", "--repeat", type=int, default=1, help="runs per size, the best time is kept")
+    parser.add_argument("--no-memory", dest="memory", action="store_false", help="skip the peak memory run")
+    parser.add_argument("--variants", action="store_true", help="compare the alternative implementations of each day")
+    args = parser.parse_args(argv)
+
+    for day in args.days or sorted(GENERATORS):
+        sizes = args.sizes or DEFAULT_SIZES[day]
+
+        if args.variants:
+            if not hasattr(load_day(day), "VARIANTS"):
+                continue
+            names, samples = bench_variants(day, sizes, args.seed, args.repeat)
+            print(format_samples(day, samples, False, names))
+        else:
+            samples = bench_day(day, sizes, args.seed, args.memory, args.repeat)
+            print(format_samples(day, samples, args.memory))
+
+        print()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,301 @@
+# Christopher Chamberlain
+# Advent of Code 2023
+# Synthetic input generators
+
+import argparse
+import itertools
+import random
+import string
+import sys
+from typing import Callable, Iterator
+
+type Generator = Callable[[int, random.Random], Iterator[str]]
+
+NUMBER_WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+
+def day_01(size: int, rng: random.Random) -> Iterator[str]:
+    """ Calibration lines, `size` lines of letters mixed with digits and spelled digits. """
+
+    for _ in range(size):
+
+        tokens = list[str]()
+        for _ in range(rng.randint(1, 8)):
+            match rng.randrange(3):
+                case 0:
+                    tokens.append("".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 6))))
+                case 1:
+                    tokens.append(rng.choice(NUMBER_WORDS))
+                case 2:
+                    tokens.append(rng.choice(string.digits[1:]))
+
+        # Each line must have at least one real digit.
+        tokens.insert(rng.randint(0, len(tokens)), rng.choice(string.digits[1:]))
+
+        yield "".join(tokens) + "\n"
+
+
+def day_02(size: int, rng: random.Random) -> Iterator[str]:
+    """ Cube games, `size` games of up to six subsets. """
+
+    for game in range(1, size + 1):
+
+        subsets = list[str]()
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+            subsets.append(", ".join(f"{rng.randint(1, 20)} {color}" for color in colors))
+
+        yield f"Game {game}: {'; '.join(subsets)}\n"
+
+
+def day_03(size: int, rng: random.Random) -> Iterator[str]:
+    """ Engine schematic, a `size` by `size` grid of numbers and symbols. """
+
+    for _ in range(size):
+
+        row = list[str]()
+        while len(row) < size:
+            match rng.randrange(8):
+                case 0:
+                    row.extend(str(rng.randint(1, 999)))
+                    row.append('.')
+                case 1:
+                    row.append(rng.choice("*#+$/=%@&-"))
+                case _:
+                    row.append('.')
+
+        yield "".join(row[:size]) + "\n"
+
+
+def day_04(size: int, rng: random.Random) -> Iterator[str]:
+    """
+    Scratchcards, `size` cards of 10 winning numbers and 25 numbers we have.
+    Mostly losing cards keep the copy counts of part 2 from growing exponentially.
+    """
+
+    width = len(str(size))
+    for card in range(1, size + 1):
+
+        # Pick how many numbers match, a card can not win copies past the end of the deck.
+        matches = min(rng.choices(range(0, 11), weights=[60, 15, 8, 5, 4, 3, 2, 1, 1, 1, 1])[0], size - card)
+
+        numbers = rng.sample(range(1, 100), 35 - matches)
+        win_numbers = numbers[:10]
+        our_numbers = numbers[10:] + win_numbers[:matches]
+        rng.shuffle(our_numbers)
+
+        win_text = " ".join(f"{x:>2}" for x in win_numbers)
+        our_text = " ".join(f"{x:>2}" for x in our_numbers)
+        yield f"Card {card:>{width}}: {win_text} | {our_text}\n"
+
+
+def day_05(size: int, rng: random.Random) -> Iterator[str]:
+    """ Almanac, `size` seed numbers (as pairs) and seven maps of `size` ranges each. """
+
+    domain = 1 << 32
+
+    seeds = list[int]()
+    for _ in range(max(1, size // 2)):
+        begin = rng.randrange(domain)
+        seeds.extend([begin, rng.randint(1, max(1, (domain - begin) // max(1, size)))])
+
+    yield f"seeds: {' '.join(str(x) for x in seeds)}\n"
+
+    names = ["seed", "soil", "fertilizer", "water", "light", "temperature", "humidity", "location"]
+    for src_name, dst_name in zip(names, names[1:]):
+
+        yield "\n"
+        yield f"{src_name}-to-{dst_name} map:\n"
+
+        # Cut the domain into pieces, then shuffle where each piece lands.
+        cuts = sorted(set(rng.sample(range(1, domain), size)) | {0, domain})
+        pieces = list(zip(cuts, cuts[1:]))
+        targets = pieces.copy()
+        rng.shuffle(targets)
+
+        dst = 0
+        for src_begin, src_end in targets:
+
+            # Leave some pieces unmapped, these fall through as identity.
+            if rng.random() >= 0.1:
+                yield f"{dst} {src_begin} {src_end - src_begin}\n"
+
+            dst += src_end - src_begin
+
+
+def day_06(size: int, rng: random.Random) -> Iterator[str]:
+    """ Races, `size` races with a time and record distance each. """
+
+    times = [rng.randint(10, 100) for _ in range(size)]
+    distances = [rng.randint(1, (t * t) // 4 - 1) for t in times]
+
+    yield "Time:      " + " ".join(f"{t:>4}" for t in times) + "\n"
+    yield "Distance:  " + " ".join(f"{d:>4}" for d in distances) + "\n"
+
+
+def day_07(size: int, rng: random.Random) -> Iterator[str]:
+    """ Camel cards, `size` hands with a bid each. """
+
+    for _ in range(size):
+        yield f"{''.join(rng.choices('23456789TJQKA', k=5))} {rng.randint(1, 1000)}\n"
+
+
+def day_08(size: int, rng: random.Random) -> Iterator[str]:
+    """
+    Network, roughly `size` nodes split between six ghosts.
+    Each ghost walks a cycle (a multiple of the instruction length) from its `A` node to its `Z` node.
+    """
+
+    # Six ghosts cycle at least 2 + 3 + 5 + 7 + 11 + 13 = 41 times in all, so small networks get short instructions.
+    ghosts = 6
+    instructions = "".join(rng.choices("LR", k=min(rng.randint(20, 60), max(1, size // 41))))
+    yield instructions + "\n"
+    yield "\n"
+
+    # Interior node names never end in 'A' or 'Z' and never collide with the start or end nodes.
+    alphabet = string.ascii_uppercase[1:-1]
+
+    def name(index: int) -> str:
+        letters = list[str]()
+        while True:
+            index, digit = divmod(index, len(alphabet))
+            letters.append(alphabet[digit])
+            if not index:
+                break
+        return "".join(reversed(letters)).rjust(4, alphabet[0])
+
+    def is_prime(n: int) -> bool:
+        return n >= 2 and all(n % d for d in range(2, int(n ** 0.5) + 1))
+
+    # Each ghost cycles a distinct prime number of times through the instructions, the primes are taken
+    # around the target so the chains add up to about `size` nodes.
+    target = max(2, size // (ghosts * len(instructions)))
+    below = list(itertools.islice(filter(is_prime, range(target - 1, 1, -1)), ghosts // 2))
+    cycles = sorted(below + list(itertools.islice(filter(is_prime, itertools.count(target)), ghosts - len(below))))
+
+    lines = list[str]()
+    counter = 0
+    for ghost in range(ghosts):
+
+        prefix = "AA" if ghost == 0 else name(ghost)[-2:]
+        start, end = prefix + "A", ("ZZ" if ghost == 0 else prefix) + "Z"
+
+        # Both directions lead along the chain, so the cycle length is the chain length.
+        steps = len(instructions) * cycles[ghost]
+        chain = [start] + [name(counter + i) for i in range(steps - 1)] + [end]
+        counter += steps
+
+        for node, successor in zip(chain, chain[1:]):
+            lines.append(f"{node} = ({successor}, {successor})\n")
+
+        # The end node loops back into the chain, just like the start node.
+        lines.append(f"{end} = ({chain[1]}, {chain[1]})\n")
+
+    rng.shuffle(lines)
+    yield from lines
+
+
+def day_09(size: int, rng: random.Random) -> Iterator[str]:
+    """ Sensor histories, `size` sequences of 21 values generated by low degree polynomials. """
+
+    for _ in range(size):
+        coefficients = [rng.randint(-9, 9) for _ in range(rng.randint(1, 7))]
+        values = [sum(c * x ** i for i, c in enumerate(coefficients)) for x in range(21)]
+        yield " ".join(str(v) for v in values) + "\n"
+
+
+def day_10(size: int, rng: random.Random) -> Iterator[str]:
+    """
+    Pipe maze, a `size` by `size` grid containing one large loop surrounded by junk pipes.
+
+    The loop is the outline of a random "skyline": it runs along the bottom row, up the right most
+    column, then steps left column by column between random heights before returning down the left.
+    """
+
+    size = max(size, 5)
+    bottom = size - 2
+
+    # Height the skyline reaches in each column, the left most column only descends back to the start.
+    tops = [0] + [rng.randint(1, bottom - 1) for _ in range(1, size - 1)] + [0]
+    tops[1] = tops[2]
+
+    # Walk the outline, starting in the lower left corner and going right.
+    path = [(x, bottom) for x in range(1, size - 1)]
+    path += [(size - 2, y) for y in range(bottom - 1, tops[size - 2] - 1, -1)]
+    for x in range(size - 2, 1, -1):
+        y0, y1 = tops[x], tops[x - 1]
+        step = 1 if y1 > y0 else -1
+        path += [(x - 1, y) for y in range(y0, y1 + step, step)]
+    path += [(1, y) for y in range(tops[1] + 1, bottom)]
+
+    # The glyph for each pair of (incoming, outgoing) directions.
+    glyphs = {
+        ((0, -1), (0, -1)): '|', ((0, 1), (0, 1)): '|',
+        ((1, 0), (1, 0)): '-', ((-1, 0), (-1, 0)): '-',
+        ((0, 1), (1, 0)): 'L', ((-1, 0), (0, -1)): 'L',
+        ((0, 1), (-1, 0)): 'J', ((1, 0), (0, -1)): 'J',
+        ((0, -1), (1, 0)): 'F', ((-1, 0), (0, 1)): 'F',
+        ((0, -1), (-1, 0)): '7', ((1, 0), (0, 1)): '7',
+    }
+
+    rows = [bytearray(rng.choices(b"|-LJ7F..", k=size)) for _ in range(size)]
+
+    for index, (x, y) in enumerate(path):
+        px, py = path[index - 1]
+        nx, ny = path[(index + 1) % len(path)]
+        rows[y][x] = ord(glyphs[((x - px, y - py), (nx - x, ny - y))])
+
+    # Place the start, and clear the junk around it so its pipe can be inferred unambiguously.
+    sx, sy = path[0]
+    rows[sy][sx] = ord('S')
+    rows[sy][sx - 1] = ord('.')
+    rows[sy + 1][sx] = ord('.')
+
+    for row in rows:
+        yield row.decode() + "\n"
+
+
+GENERATORS: dict[int, Generator] = {
+    1: day_01,
+    2: day_02,
+    3: day_03,
+    4: day_04,
+    5: day_05,
+    6: day_06,
+    7: day_07,
+    8: day_08,
+    9: day_09,
+    10: day_10,
+}
+
+
+def generate(day: int, size: int, seed: int = 0) -> Iterator[str]:
+    """ Produces the lines of a synthetic input for the given day, the same seed always produces the same input. """
+    return GENERATORS[day](size, random.Random(seed))
+
+
+def generate_text(day: int, size: int, seed: int = 0) -> str:
+    return "".join(generate(day, size, seed))
+
+
+def main(argv: list[str] | None = None) -> int:
+
+    parser = argparse.ArgumentParser(prog="aoc.generators", description="Writes a synthetic input for a day.")
+    parser.add_argument("day", type=int, choices=sorted(GENERATORS))
+    parser.add_argument("size", type=int, help="lines, cards, hands, etc. (grid side length for days 3 and 10)")
+    parser.add_argument("-s", "--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="output path (default: stdout)")
+    args = parser.parse_args(argv)
+
+    file = open(args.output, "w", encoding='utf-8', newline='\n') if args.output else sys.stdout
+    try:
+        file.writelines(generate(args.day, args.size, args.seed))
+    finally:
+        if args.output:
+            file.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+# Christopher Chamberlain
+# Advent of Code 2023
+# Dense grid
+
+from typing import Iterable, Iterator
+
+
+class Grid:
+    """
+    A dense 2D grid of bytes, stored row major in a flat `bytearray`.
+
+    The grid is surrounded by a one cell border of sentinel bytes, so looking at the neighbors
+    of any cell inside the grid never needs a bounds check. Cells are addressed by their integer
+    index into `cells`, neighbors are reached by adding one of the precomputed offsets.
+
+    ```txt
+    ......     <- border
+    .467..
+    .*....     index(x, y) = (y + 1) * stride + (x + 1)
+    ......
+    ```
+    """
+
+    __slots__ = ("width", "height", "stride", "cells", "neighbors4", "neighbors8")
+
+    def __init__(self, width: int, height: int, fill: int = ord('.'), border: int = ord('.')):
+
+        self.width = width
+        self.height = height
+        self.stride = width + 2
+
+        self.cells = bytearray([border]) * (self.stride * (height + 2))
+        for y in range(height):
+            start = self.index(0, y)
+            self.cells[start:start + width] = bytes([fill]) * width
+
+        stride = self.stride
+
+        # Index offsets to the 4-direction neighbors (up, right, down, left).
+        self.neighbors4: tuple[int, ...] = (-stride, +1, +stride, -1)
+
+        # Index offsets to all 8-direction neighbors.
+        self.neighbors8: tuple[int, ...] = (
+            -stride - 1, -stride, -stride + 1,
+            -1, +1,
+            +stride - 1, +stride, +stride + 1,
+        )
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str | bytes], border: int = ord('.')) -> 'Grid':
+        """ Loads a grid from its rows, short rows are padded with the border byte. """
+
+        rows = [line.encode('ascii') if isinstance(line, str) else bytes(line) for line in lines]
+        width = max((len(row) for row in rows), default=0)
+
+        grid = cls(width, len(rows), border, border)
+        for y, row in enumerate(rows):
+            start = grid.index(0, y)
+            grid.cells[start:start + len(row)] = row
+
+        return grid
+
+    def index(self, x: int, y: int) -> int:
+        """ Gets the cell index of the coordinate. """
+        return (y + 1) * self.stride + (x + 1)
+
+    def coord(self, index: int) -> tuple[int, int]:
+        """ Gets the coordinate of the cell index. """
+        y, x = divmod(index, self.stride)
+        return (x - 1, y - 1)
+
+    def get(self, x: int, y: int) -> int:
+        return self.cells[self.index(x, y)]
+
+    def row(self, y: int) -> memoryview:
+        """ A view of the cells in a row. """
+        start = self.index(0, y)
+        return memoryview(self.cells)[start:start + self.width]
+
+    def column(self, x: int) -> memoryview:
+        """ A (strided) view of the cells in a column. """
+        start = self.index(x, 0)
+        return memoryview(self.cells)[start:start + self.height * self.stride:self.stride]
+
+    def indices(self) -> Iterator[int]:
+        """ Iterates the index of every cell inside the border, in row major order. """
+        for y in range(self.height):
+            start = self.index(0, y)
+            yield from range(start, start + self.width)
+
+    def find(self, value: int) -> int:
+        """ Finds the index of the first cell (inside the border) with the given value, or -1. """
+        return self.cells.find(value, self.stride, len(self.cells) - self.stride)
+
+    def __getitem__(self, index: int) -> int:
+        return self.cells[index]
+
+    def __setitem__(self, index: int, value: int):
+        self.cells[index] = value
@@ -0,0 +1,306 @@
+# Christopher Chamberlain
+# Advent of Code 2023
+# Integer intervals
+
+import argparse
+import bisect
+import heapq
+import math
+import random
+import sys
+import timeit
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional
+
+
+class Interval:
+    """
+    A half open range of integers, `begin <= value < end`.
+    Slotted, so creating one and reading its bounds is cheaper than with a regular dataclass.
+    """
+
+    __slots__ = ("begin", "end")
+
+    def __init__(self, begin: int, end: int):
+        self.begin = begin
+        self.end = end
+
+    @property
+    def size(self) -> int:
+        return self.end - self.begin
+
+    def intersection(self, other: 'Interval') -> Optional['Interval']:
+        '''
+        Computes the intersection between this interval and another.
+        Will return `None` if the intervals are not intersecting.
+
+        ```txt
+        self:   |-----|
+        other:    |-----|
+        result:   |---|
+        ```
+        '''
+
+        begin = max(self.begin, other.begin)
+        end = min(self.end, other.end)
+
+        if begin >= end:
+            return None
+
+        return Interval(begin, end)
+
+    def shift(self, offset: int) -> 'Interval':
+        return Interval(self.begin + offset, self.end + offset)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter((self.begin, self.end))
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Interval) and self.begin == other.begin and self.end == other.end
+
+    def __repr__(self) -> str:
+        return f"Interval({self.begin}, {self.end})"
+
+
+class IntervalSet:
+    """
+    A set of integers stored as sorted, disjoint `(begin, end)` tuples. Intervals that overlap or touch
+    are merged, so each set has exactly one representation. The bulk operations walk both sets once, in order.
+    """
+
+    __slots__ = ("intervals",)
+
+    def __init__(self, intervals: Iterable[tuple[int, int] | Interval] = ()):
+        self.intervals = self.coalesce(sorted(map(tuple, intervals)))
+
+    @staticmethod
+    def coalesce(ordered: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+        """ Merges intervals, sorted by their begin, that overlap or touch. Empty intervals are dropped. """
+
+        merged = list[tuple[int, int]]()
+        for begin, end in ordered:
+            if begin >= end:
+                continue
+            if merged and begin <= merged[-1][1]:
+                if end > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], end)
+            else:
+                merged.append((begin, end))
+
+        return merged
+
+    @classmethod
+    def from_normalized(cls, intervals: list[tuple[int, int]]) -> 'IntervalSet':
+        """ Wraps intervals that are already sorted and merged, without checking them. """
+        result = cls.__new__(cls)
+        result.intervals = intervals
+        return result
+
+    def union(self, other: 'IntervalSet') -> 'IntervalSet':
+        return self.from_normalized(self.coalesce(heapq.merge(self.intervals, other.intervals)))
+
+    def intersection(self, other: 'IntervalSet') -> 'IntervalSet':
+
+        result = list[tuple[int, int]]()
+        these, those = self.intervals, other.intervals
+
+        i = j = 0
+        while i < len(these) and j < len(those):
+
+            (this_begin, this_end), (that_begin, that_end) = these[i], those[j]
+
+            begin = max(this_begin, that_begin)
+            end = min(this_end, that_end)
+            if begin < end:
+                result.append((begin, end))
+
+            # Advance whichever interval finishes first.
+            if this_end < that_end:
+                i += 1
+            else:
+                j += 1
+
+        return self.from_normalized(result)
+
+    def difference(self, other: 'IntervalSet') -> 'IntervalSet':
+
+        result = list[tuple[int, int]]()
+        those = other.intervals
+
+        j = 0
+        for begin, end in self.intervals:
+
+            # Skip the intervals that finish before this one begins.
+            while j < len(those) and those[j][1] <= begin:
+                j += 1
+
+            # Cut out each interval that overlaps, the last may overlap the next interval too.
+            k = j
+            while k < len(those) and those[k][0] < end:
+                if those[k][0] > begin:
+                    result.append((begin, those[k][0]))
+                begin = max(begin, those[k][1])
+                k += 1
+
+            if begin < end:
+                result.append((begin, end))
+
+        return self.from_normalized(result)
+
+    def lowest(self, begin: int, end: int | float = math.inf) -> int | None:
+        """ The lowest member of the set in the range, found by binary search, or `None` when the range holds none. """
+
+        if begin >= end:
+            return None
+
+        intervals = self.intervals
+
+        # The last interval beginning at or before the range, it may reach into the range.
+        i = bisect.bisect_right(intervals, (begin, math.inf)) - 1
+        if i >= 0 and intervals[i][1] > begin:
+            return begin
+
+        if i + 1 < len(intervals) and intervals[i + 1][0] < end:
+            return intervals[i + 1][0]
+
+        return None
+
+    def shift(self, offset: int) -> 'IntervalSet':
+        return self.from_normalized([(begin + offset, end + offset) for begin, end in self.intervals])
+
+    def __or__(self, other: 'IntervalSet') -> 'IntervalSet':
+        return self.union(other)
+
+    def __and__(self, other: 'IntervalSet') -> 'IntervalSet':
+        return self.intersection(other)
+
+    def __sub__(self, other: 'IntervalSet') -> 'IntervalSet':
+        return self.difference(other)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return iter(self.intervals)
+
+    def __getitem__(self, index: int) -> tuple[int, int]:
+        return self.intervals[index]
+
+    def __len__(self) -> int:
+        return len(self.intervals)
+
+    def __bool__(self) -> bool:
+        return bool(self.intervals)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, IntervalSet) and self.intervals == other.intervals
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({self.intervals})"
+
+
+@dataclass
+class DataclassRange:
+    """ The plain dataclass range the intervals replace, kept as the baseline for the microbenchmarks. """
+
+    begin: int
+    end: int
+
+    @property
+    def size(self) -> int:
+        return self.end - self.begin
+
+    def intersects(self, other: 'DataclassRange') -> Optional['DataclassRange']:
+
+        begin = max(self.begin, other.begin)
+        end = min(self.end, other.end)
+
+        if begin >= end:
+            return None
+
+        return DataclassRange(begin, end)
+
+
+@dataclass
+class PropertyAlmanacRange:
+    """ The day 5 table entry the slotted `AlmanacRange` replaces, each `src`/`dst` access allocates a new range. """
+
+    _dst: int
+    _src: int
+    _len: int
+
+    @property
+    def src(self) -> DataclassRange:
+        return DataclassRange(self._src, self._src + self._len)
+
+    @property
+    def dst(self) -> DataclassRange:
+        return DataclassRange(self._dst, self._dst + self._len)
+
+
+def microbenchmarks(count: int, seed: int = 0) -> dict[str, float]:
+    """
+    Times creating, sorting and intersecting `count` ranges, with the dataclass and with intervals,
+    then sorting and reading the bounds of day 5's table entries, the property based baseline
+    against the current slotted `AlmanacRange`, then the bulk operations of the interval sets.
+    """
+
+    # Imported here, day 5 itself depends on this module.
+    from aoc.runner import load_day
+    AlmanacRange = load_day(5).AlmanacRange
+
+    rng = random.Random(seed)
+
+    # Short ranges spread over the domain, so the sets keep many disjoint intervals.
+    bounds = list[tuple[int, int]]()
+    for _ in range(count):
+        begin = rng.randrange(1 << 32)
+        bounds.append((begin, begin + rng.randint(1, (1 << 32) // count)))
+
+    ranges = [DataclassRange(begin, end) for begin, end in bounds]
+    intervals = [Interval(begin, end) for begin, end in bounds]
+    probe_range, probe_interval = DataclassRange(1 << 30, 1 << 31), Interval(1 << 30, 1 << 31)
+
+    # Table entries over the same sources, each sent to a random destination.
+    destinations = [rng.randrange(1 << 32) for _ in range(count)]
+    property_entries = [PropertyAlmanacRange(dst, begin, end - begin) for dst, (begin, end) in zip(destinations, bounds)]
+    slotted_entries = [AlmanacRange(dst, begin, end - begin) for dst, (begin, end) in zip(destinations, bounds)]
+
+    half = IntervalSet(intervals[:count // 2])
+    other = IntervalSet(intervals[count // 2:])
+
+    def best(statement) -> float:
+        return min(timeit.repeat(statement, number=1, repeat=3))
+
+    return {
+        "create dataclass": best(lambda: [DataclassRange(begin, end) for begin, end in bounds]),
+        "create interval": best(lambda: [Interval(begin, end) for begin, end in bounds]),
+        "sort dataclass": best(lambda: sorted(ranges, key=lambda r: r.begin)),
+        "sort interval": best(lambda: sorted(intervals, key=lambda i: i.begin)),
+        "sort tuple": best(lambda: sorted(bounds)),
+        "intersect dataclass": best(lambda: [r.intersects(probe_range) for r in ranges]),
+        "intersect interval": best(lambda: [i.intersection(probe_interval) for i in intervals]),
+        "sort entry property": best(lambda: sorted(property_entries, key=lambda r: r.src.begin)),
+        "sort entry slotted": best(lambda: sorted(slotted_entries, key=lambda r: r.src)),
+        "access entry property": best(lambda: [r.dst.begin - r.src.begin + r.src.end for r in property_entries]),
+        "access entry slotted": best(lambda: [r.dst - r.src + r.src_end for r in slotted_entries]),
+        "set normalize": best(lambda: IntervalSet(intervals)),
+        "set union": best(lambda: half | other),
+        "set intersection": best(lambda: half & other),
+        "set difference": best(lambda: half - other),
+        "set shift": best(lambda: half.shift(1 << 20)),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+
+    parser = argparse.ArgumentParser(prog="aoc.intervals", description="Microbenchmarks of the interval types.")
+    parser.add_argument("-n", "--count", type=int, default=100_000, help="number of ranges")
+    parser.add_argument("-s", "--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    for name, seconds in microbenchmarks(args.count, args.seed).items():
+        print(f"{name:<22} {seconds * 1000:>10.3f} ms")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
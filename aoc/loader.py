@@ -0,0 +1,184 @@
+# Christopher Chamberlain
+# Advent of Code 2023
+# Memory mapped input loader
+
+import mmap
+from pathlib import Path
+from typing import Iterator
+
+from aoc.grid import Grid
+
+
+def iter_lines(data: bytes | mmap.mmap, start: int = 0, end: int | None = None) -> Iterator[bytes]:
+    """ Lazily produces each line of the buffer (or a byte range of it) as `bytes`, without line endings. """
+
+    if end is None:
+        end = len(data)
+
+    while start < end:
+
+        stop = data.find(b"\n", start, end)
+        if stop < 0:
+            stop = end
+
+        # Tolerate '\r\n' line endings.
+        line_end = stop - 1 if stop > start and data[stop - 1] == ord('\r') else stop
+
+        yield data[start:line_end]
+        start = stop + 1
+
+
+class MappedFile:
+    """
+    A read-only memory mapping of an input file.
+    Nothing is read until it is touched, so inputs much larger than memory can be scanned.
+    """
+
+    def __init__(self, path: str | Path):
+
+        self.file = open(path, "rb")
+
+        # Empty files can not be mapped.
+        if size := Path(path).stat().st_size:
+            self.data = mmap.mmap(self.file.fileno(), size, access=mmap.ACCESS_READ)
+        else:
+            self.data = b""
+
+        self.view = memoryview(self.data)
+
+    def lines(self, start: int = 0, end: int | None = None) -> 'MappedLines':
+        return MappedLines(self, start, end)
+
+    def grid(self) -> 'MappedGrid':
+        return MappedGrid(self)
+
+    def close(self):
+        self.view.release()
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self.file.close()
+
+    def __enter__(self) -> 'MappedFile':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class MappedLines:
+    """
+    The lines of a mapped file (or a byte range of it), without line endings.
+    Each iteration scans the mapping again, producing one line at a time as `bytes`.
+    The lines borrow the mapping, the caller keeps the file open while they are read.
+    """
+
+    def __init__(self, file: MappedFile, start: int = 0, end: int | None = None):
+        self.file = file
+        self.start = start
+        self.end = len(file.data) if end is None else end
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter_lines(self.file.data, self.start, self.end)
+
+
+class MappedGrid:
+    """
+    A rectangular grid of characters, indexed directly into the mapping.
+    The line ending of each row is kept in the stride, so `index(x, y) = y * (W + 1) + x`.
+    """
+
+    def __init__(self, file: MappedFile):
+
+        self.file = file
+        self.cells = file.view
+
+        data = file.data
+        newline = data.find(b"\n")
+
+        if newline < 0:  # a single row
+            self.width = len(data)
+            self.stride = len(data) + 1
+        else:
+            self.width = newline - 1 if newline > 0 and data[newline - 1] == ord('\r') else newline
+            self.stride = newline + 1
+
+        # The last row may not have a line ending.
+        self.height = -(-len(data) // self.stride)
+
+    def index(self, x: int, y: int) -> int:
+        return y * self.stride + x
+
+    def get(self, x: int, y: int) -> int:
+        return self.cells[y * self.stride + x]
+
+    def row(self, y: int) -> memoryview:
+        start = y * self.stride
+        return self.cells[start:start + self.width]
+
+    def rows(self) -> Iterator[memoryview]:
+        for y in range(self.height):
+            yield self.row(y)
+
+    def to_grid(self, border: int = ord('.')) -> Grid:
+        """ Copies the cells into a (bordered) `Grid`, row by row, without decoding any text. """
+
+        grid = Grid(self.width, self.height, border, border)
+        for y in range(self.height):
+            start = grid.index(0, y)
+            row = self.row(y)
+            grid.cells[start:start + len(row)] = row
+            row.release()
+
+        return grid
+
+
+class FileLines:
+    """
+    The lines of a file, without line endings. Each iteration maps the file and closes the mapping
+    (and its file descriptor) again once the iteration finishes, or the iterator is discarded.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = path
+
+    def __iter__(self) -> Iterator[bytes]:
+        with MappedFile(self.path) as file:
+            yield from iter_lines(file.data)
+
+
+def load_lines(path: str | Path) -> FileLines:
+    """ Lazily produces the lines of the file, nothing stays open between iterations. """
+    return FileLines(path)
+
+
+def chunk_ranges(path: str | Path, count: int) -> list[tuple[int, int]]:
+    """
+    Splits the file into (at most) `count` byte ranges of similar size.
+    Each range ends just after a line ending, so every line belongs to exactly one range.
+    """
+
+    with MappedFile(path) as file:
+
+        size = len(file.data)
+
+        ranges = list[tuple[int, int]]()
+        start = 0
+        for n in range(1, count + 1):
+
+            # Move the ideal split point forward to the start of the next line.
+            end = size * n // count
+            if end < size:
+                newline = file.data.find(b"\n", max(end - 1, start))
+                end = size if newline < 0 else newline + 1
+
+            if end > start:
+                ranges.append((start, end))
+                start = end
+
+        return ranges
+
+
+def load_grid(path: str | Path, border: int = ord('.')) -> Grid:
+    """ Loads a grid file straight from the mapping into a `Grid`. """
+    with MappedFile(path) as file:
+        return file.grid().to_grid(border)
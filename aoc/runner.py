@@ -0,0 +1,128 @@
+# Christopher Chamberlain
+# Advent of Code 2023
+# Runner
+
+import argparse
+import importlib
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
+# The repository root, each day is a directory `NN` below this.
+ROOT = Path(__file__).resolve().parents[1]
+
+# Day directories (ie. `01`) are not valid identifiers, but can still be imported as namespace packages.
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+@dataclass
+class Timing:
+    label: str
+    seconds: float
+    answer: Any = None
+
+
+def available_days() -> list[int]:
+    """ Finds each day that has a solver module. """
+    return sorted(int(path.parent.name) for path in ROOT.glob("[0-9][0-9]/day_[0-9][0-9].py"))
+
+
+def load_day(day: int) -> ModuleType:
+    """ Imports the solver module for the given day. """
+    return importlib.import_module(f"{day:02}.day_{day:02}")
+
+
+def input_path(day: int, pattern: str | None = None) -> Path:
+    """
+    Gets the input path for the given day.
+    The pattern may reference the day number, ie. `inputs/{day:02}.txt`.
+    """
+
+    if pattern is None:
+        return ROOT / f"{day:02}" / f"day_{day:02}_input.txt"
+
+    return Path(pattern.format(day=day))
+
+
+def timed(function: Callable[..., Any], *args: Any) -> tuple[Any, float]:
+    """ Calls the function, returning its result and the elapsed wall time in seconds. """
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def run_day(day: int, path: Path | None = None, parts: tuple[int, ...] = (1, 2), mapped: bool = False,
+            jobs: int | None = None, stream: bool = False) -> list[Timing]:
+    """
+    Parses the input once and solves each requested part, timing each step.
+    When `mapped`, days that provide `load(path)` read the memory mapped file instead of the decoded text.
+    When given `jobs`, days that provide `solve_parallel(path, part, jobs)` solve each part straight from the file.
+    When `stream`, days that provide `solve_stream(path, part)` solve each part straight from the file in bounded memory.
+    """
+
+    module = load_day(day)
+    path = path or input_path(day)
+
+    if jobs and hasattr(module, "solve_parallel"):
+        timings = list[Timing]()
+        for part in parts:
+            answer, seconds = timed(module.solve_parallel, path, part, jobs)
+            timings.append(Timing(f"part {part}", seconds, answer))
+        return timings
+
+    if stream and hasattr(module, "solve_stream"):
+        timings = list[Timing]()
+        for part in parts:
+            answer, seconds = timed(module.solve_stream, path, part)
+            timings.append(Timing(f"part {part}", seconds, answer))
+        return timings
+
+    if mapped and hasattr(module, "load"):
+        parsed, seconds = timed(module.load, path)
+        timings = [Timing("load", seconds)]
+    else:
+        text = path.read_text(encoding='utf-8')
+        parsed, seconds = timed(module.parse, text)
+        timings = [Timing("parse", seconds)]
+
+    for part in parts:
+        answer, seconds = timed(getattr(module, f"part{part}"), parsed)
+        timings.append(Timing(f"part {part}", seconds, answer))
+
+    return timings
+
+
+def format_timings(day: int, timings: list[Timing]) -> str:
+
+    lines = list[str]()
+    for index, timing in enumerate(timings):
+        header = f"Day {day:02}" if index == 0 else ""
+        answer = "" if timing.answer is None else str(timing.answer)
+        lines.append(f"{header:<8}{timing.label:<8}{timing.seconds * 1000:>12.3f} ms    {answer}".rstrip())
+
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+
+    parser = argparse.ArgumentParser(prog="aoc", description="Runs the Advent of Code solvers and times each step.")
+    parser.add_argument("days", nargs="*", type=int, help="days to run (default: all)")
+    parser.add_argument("-i", "--input", help="input path, may use {day} ie. 'inputs/{day:02}.txt'")
+    parser.add_argument("-p", "--part", type=int, choices=[1, 2], action="append", help="parts to run (default: both)")
+    parser.add_argument("-m", "--mmap", action="store_true", help="memory map the input, for days that support it")
+    parser.add_argument("-j", "--jobs", type=int, help="solve with a pool of processes, for days that support it")
+    parser.add_argument("-S", "--stream", action="store_true", help="stream the input in bounded memory, for days that support it")
+    args = parser.parse_args(argv)
+
+    days = args.days or available_days()
+    parts = tuple(args.part or [1, 2])
+
+    for day in days:
+        path = input_path(day, args.input)
+        print(format_timings(day, run_day(day, path, parts, args.mmap, args.jobs, args.stream)))
+
+    return 0